@@ -6,8 +6,50 @@ Supports both constant and year-specific-flat discounting modes.
 """
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from dcf_engine.models import DiscountingMode
 
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def _constant_factors(
+    rates: dict[int, float] | float,
+    years: list[int],
+    base_year: int
+) -> dict[int, float]:
+    if not years:
+        return {}
+    if isinstance(rates, dict):
+        if not rates:
+            raise ValueError("no discount rate available")
+        # Use first year's rate as constant
+        r = next(iter(rates.values()))
+    else:
+        r = rates
+    return {year: 1.0 / ((1 + r) ** (year - base_year)) for year in years}
+
+
+def _year_specific_factors(
+    rates: dict[int, float] | float,
+    years: list[int],
+    base_year: int
+) -> dict[int, float]:
+    # Use year i's rate applied for i periods
+    if isinstance(rates, dict):
+        return {
+            year: 1.0 / ((1 + rates[year]) ** (year - base_year))
+            for year in years
+        }
+    return {year: 1.0 / ((1 + rates) ** (year - base_year)) for year in years}
+
+
+_DISCOUNT_FACTORS = {
+    DiscountingMode.CONSTANT: _constant_factors,
+    DiscountingMode.YEAR_SPECIFIC_FLAT: _year_specific_factors,
+}
+
 
 def compute_discount_factors(
     rates: dict[int, float] | float,
@@ -27,30 +69,36 @@ def compute_discount_factors(
         where r_i is the rate for year i, applied for i periods
     
     Returns:
-        dict mapping year -> discount factor
+        dict mapping year -> discount factor (empty for an unknown mode)
     """
-    discount_factors = {}
+    factors = _DISCOUNT_FACTORS.get(mode)
+    if factors is None:
+        return {}
+    return factors(rates, years, base_year)
+
+
+def compute_discount_factors_vec(
+    rates: np.ndarray,
+    periods: np.ndarray
+) -> np.ndarray:
+    """
+    Compute discount factors for a batch of rate scenarios at once.
+    
+    Same year-specific-flat convention as compute_discount_factors:
+        DF_i = 1 / (1 + r_i)^i
+    A constant rate is a rates array repeated along the year axis.
     
-    for year in years:
-        period = year - base_year  # 1, 2, 3, ...
-        
-        if mode == DiscountingMode.CONSTANT:
-            if isinstance(rates, dict):
-                # Use first year's rate as constant
-                r = list(rates.values())[0]
-            else:
-                r = rates
-            discount_factors[year] = 1.0 / ((1 + r) ** period)
-        
-        elif mode == DiscountingMode.YEAR_SPECIFIC_FLAT:
-            if isinstance(rates, dict):
-                r = rates[year]
-            else:
-                r = rates
-            # Use year i's rate applied for i periods
-            discount_factors[year] = 1.0 / ((1 + r) ** period)
+    Args:
+        rates: Discount rates, shape (n_scenarios, n_years) or (n_years,)
+        periods: Period numbers (1, 2, 3, ...), shape (n_years,)
     
-    return discount_factors
+    Returns:
+        Discount factors with the broadcast shape of rates and periods
+    """
+    import numpy as np
+
+    rates = np.asarray(rates, dtype=np.float64)
+    return np.power(1.0 + rates, -np.asarray(periods, dtype=np.float64))
 
 
 def compute_pv_series(
@@ -73,6 +121,23 @@ def compute_pv_series(
     return pv
 
 
+def compute_pv_series_vec(
+    cash_flows: np.ndarray,
+    discount_factors: np.ndarray
+) -> np.ndarray:
+    """
+    Compute present values for a batch of cash-flow series at once.
+    
+    PV(CF_i) = CF_i * DF_i, elementwise with broadcasting.
+    
+    Returns:
+        Array of present values
+    """
+    import numpy as np
+
+    return np.multiply(cash_flows, discount_factors, dtype=np.float64)
+
+
 def compute_pv_single(
     value: float,
     rate: float,
@@ -8,7 +8,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
 
 
 class DiscountingMode(str, Enum):
@@ -330,3 +330,17 @@ class DCFOutputs(BaseModel):
 
     # Equity book roll-forward (if applicable)
     equity_book_values: Optional[dict[int, float]] = None
+
+    _by_year: dict[str, dict[int, BaseModel]] = PrivateAttr(default_factory=dict)
+
+    def by_year(self, collection: str) -> dict[int, BaseModel]:
+        """
+        Index a per-year schedule (e.g. "projections", "cash_flows") by year.
+        
+        Built on first use and memoized; outputs are treated as read-only.
+        """
+        index = self._by_year.get(collection)
+        if index is None:
+            index = {row.year: row for row in getattr(self, collection)}
+            self._by_year[collection] = index
+        return index
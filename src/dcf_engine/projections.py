@@ -5,8 +5,13 @@ Revenue, EBITDA, EBIT, NWC computations.
 """
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from dcf_engine.models import DCFInputs
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 def compute_revenue(inputs: DCFInputs) -> dict[int, float]:
     """
@@ -44,6 +49,26 @@ def compute_revenue(inputs: DCFInputs) -> dict[int, float]:
     return revenue
 
 
+def compute_revenue_vec(base: np.ndarray, growth: np.ndarray) -> np.ndarray:
+    """
+    Compute forecast revenue for a batch of scenarios at once.
+    
+    Revenue_t = Base * prod(1 + g_1..g_t)
+    
+    Args:
+        base: Base-year revenue, shape (n_scenarios,) or scalar
+        growth: Growth rates, shape (n_scenarios, n_years) or (n_years,)
+    
+    Returns:
+        Forecast revenue with the shape of growth (base year excluded)
+    """
+    import numpy as np
+
+    growth = np.asarray(growth, dtype=np.float64)
+    base = np.asarray(base, dtype=np.float64)
+    return base[..., None] * np.cumprod(1.0 + growth, axis=-1)
+
+
 def compute_operating_costs(
     inputs: DCFInputs,
     revenue: dict[int, float]
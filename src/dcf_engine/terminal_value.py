@@ -5,12 +5,17 @@ Perpetuity (Gordon) and Exit Multiple methods.
 """
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from dcf_engine.models import (
     TerminalValueMethod,
     ExitMultipleMetric,
     DCFInputs,
 )
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class TerminalValueError(Exception):
     """Raised when terminal value calculation fails."""
@@ -53,6 +58,32 @@ def compute_terminal_value_perpetuity(
         return final_cash_flow * (1 + growth_rate) / (discount_rate - growth_rate)
 
 
+def compute_terminal_value_perpetuity_vec(
+    final_cash_flow: np.ndarray,
+    discount_rate: np.ndarray,
+    growth_rate: np.ndarray
+) -> np.ndarray:
+    """
+    Compute perpetuity terminal values for a batch of scenarios at once.
+    
+    TV = CF_N * (1 + g) / (r - g), elementwise with broadcasting.
+    
+    Scenarios with g >= r have no finite terminal value and are returned
+    as NaN instead of raising, so one bad draw does not abort the batch.
+    
+    Returns:
+        Array of terminal values
+    """
+    import numpy as np
+
+    cf = np.asarray(final_cash_flow, dtype=np.float64)
+    r = np.asarray(discount_rate, dtype=np.float64)
+    g = np.asarray(growth_rate, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tv = cf * (1.0 + g) / (r - g)
+    return np.where(g < r, tv, np.nan)
+
+
 def compute_terminal_value_exit_multiple(
     metric_value: float,
     multiple: float
@@ -179,6 +179,33 @@ class BiometanoProjections:
             if f.year == year:
                 return f
         return None
+    
+    def capex_by_year(self) -> dict[int, float]:
+        """Total CAPEX by year, taking the same entry as get_capex for each year."""
+        return {c.year: c.total for c in reversed(self.capex)}
+    
+    def as_fcff_arrays(
+        self,
+    ) -> tuple[list[int], list[float], list[float], list[float], list[float], list[float]]:
+        """Operating-year FCFF components as parallel lists.
+        
+        Returns:
+            (years, ebit, depreciation, delta_nwc, capex_total, fcff)
+        """
+        years = list(self.operating_years)
+        capex_by_year = self.capex_by_year()
+        ebit = self.ebit.get
+        dep = self.depreciation.get
+        nwc = self.delta_nwc.get
+        fcff = self.fcff.get
+        return (
+            years,
+            [ebit(y, 0.0) for y in years],
+            [dep(y, 0.0) for y in years],
+            [nwc(y, 0.0) for y in years],
+            [capex_by_year.get(y, 0.0) for y in years],
+            [fcff(y, 0.0) for y in years],
+        )
 
 
 class BiometanoBuilder:
@@ -216,7 +243,7 @@ class BiometanoBuilder:
         
         # Step 2: CAPEX schedule
         projections.capex = self._build_capex()
-        capex_by_year = {c.year: c.total for c in projections.capex}
+        capex_by_year = projections.capex_by_year()
         
         # Step 3: Financing schedule
         projections.financing = self._build_financing(capex_by_year)
@@ -638,14 +665,14 @@ class BiometanoBuilder:
     def _compute_cash_flows(self, projections: BiometanoProjections) -> None:
         """Compute FCFF and FCFE."""
         tax_rate = self.case.financing.tax_rate
+        capex_by_year = projections.capex_by_year()
         
         for year in projections.all_forecast_years:
             ebit = projections.ebit.get(year, 0.0)
             depreciation = projections.depreciation.get(year, 0.0)
             delta_nwc = projections.delta_nwc.get(year, 0.0)
             
-            capex = projections.get_capex(year)
-            capex_total = capex.total if capex else 0.0
+            capex_total = capex_by_year.get(year, 0.0)
             
             interest = projections.interest.get(year, 0.0)
             tax_credit = projections.tax_credit_utilization.get(year, 0.0)
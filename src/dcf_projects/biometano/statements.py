@@ -253,6 +253,7 @@ class StatementsBuilder:
         prev_ar = 0.0
         prev_ap = 0.0
         prev_cash = self.case.financing.cash_at_base
+        capex_by_year = proj.capex_by_year()
         
         for year in proj.all_forecast_years:
             stmt = CashFlowLine(year=year)
@@ -287,8 +288,7 @@ class StatementsBuilder:
             )
             
             # CFI
-            capex = proj.get_capex(year)
-            stmt.capex = -(capex.total) if capex else 0.0  # Outflow
+            stmt.capex = -capex_by_year.get(year, 0.0)  # Outflow
             
             # Grant cash received (classified in CFI per policy)
             grant_cash = 0.0
@@ -0,0 +1,29 @@
+"""
+Console helpers shared by the DCF and Biometano displays.
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Iterator
+
+from rich.console import Console
+
+
+def make_console() -> Console:
+    """Create a display console.
+
+    Nothing is styled off a terminal, so there the repr highlighter's regexes
+    are skipped.
+    """
+    console = Console()
+    if console.color_system is None:
+        console = Console(highlight=False)
+    return console
+
+
+@contextmanager
+def single_write(console: Console) -> Iterator[None]:
+    """Capture everything printed to ``console`` in the block and emit it with one write."""
+    with console.capture() as capture:
+        yield
+    console.file.write(capture.get())
@@ -18,27 +18,15 @@ Report Section Order:
 """
 from __future__ import annotations
 
+import stat
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
-import yaml
 from rich.console import Console
 
-from dcf_projects.biometano.schema import BiometanoCase, DEFAULT_ZES_CREDIT_RATE
-from dcf_projects.biometano.builder import build_projections
-from dcf_projects.biometano.statements import build_statements
-from dcf_projects.biometano.valuation import compute_valuation
-from dcf_projects.biometano.sensitivities import run_sensitivity_analysis
-from dcf_projects.biometano.inputs_recap import display_inputs_recap
-from dcf_ui_cli.biometano_display import (
-    display_all_biometano,
-    display_sensitivity_tornado,
-    display_scenario_comparison,
-    display_incentives_waterfall,
-)
-from dcf_ui_cli.biometano_charts import save_biometano_charts, show_biometano_charts
-from dcf_io.writers import export_xlsx_biometano, export_csv_biometano
+if TYPE_CHECKING:
+    from dcf_projects.biometano.schema import BiometanoCase
 
 
 app = typer.Typer(
@@ -69,15 +57,21 @@ def _resolve_input_file(input_file: Optional[Path], input_option: Optional[Path]
     resolved = input_option or input_file
     if resolved is None:
         raise typer.BadParameter("Missing input file. Provide a positional INPUT_FILE or --input.")
-    if not resolved.exists():
+    try:
+        mode = resolved.stat().st_mode  # one syscall for both checks
+    except (FileNotFoundError, NotADirectoryError):
         raise typer.BadParameter(f"Input file not found: {resolved}")
-    if not resolved.is_file():
+    if not stat.S_ISREG(mode):
         raise typer.BadParameter(f"Input path is not a file: {resolved}")
     return resolved
 
 
 def _load_case(input_file: Path) -> BiometanoCase:
     """Load and validate a BiometanoCase from YAML/JSON."""
+    import yaml
+
+    from dcf_projects.biometano.schema import BiometanoCase
+
     with open(input_file) as f:
         if input_file.suffix in (".yaml", ".yml"):
             data = yaml.safe_load(f)
@@ -102,6 +96,10 @@ def init(
     Creates a template with default values that can be customized.
     Uses ZES credit rate of 14.6189% by default.
     """
+    import yaml
+
+    from dcf_projects.biometano.schema import DEFAULT_ZES_CREDIT_RATE
+
     template = {
         "horizon": {
             "base_year": 2024,
@@ -241,6 +239,13 @@ def run(
     
     Default methodology: Enterprise Value (FCFF/WACC).
     """
+    from dcf_projects.biometano.builder import build_projections
+    from dcf_projects.biometano.inputs_recap import display_inputs_recap
+    from dcf_projects.biometano.statements import build_statements
+    from dcf_projects.biometano.valuation import compute_valuation
+    from dcf_ui_cli.biometano_display import display_all_biometano
+    from dcf_io.writers import export_xlsx_biometano
+
     try:
         input_file = _resolve_input_file(input_file, input_option)
         console.print(f"[dim]Loading case: {input_file}[/dim]")
@@ -263,10 +268,12 @@ def run(
             display_all_biometano(projections, statements, valuation, methodology=value)
         
         if charts:
+            from dcf_ui_cli.biometano_charts import show_biometano_charts
             console.print("[dim]Opening charts in browser...[/dim]")
             show_biometano_charts(projections, valuation)
         
         if charts_dir:
+            from dcf_ui_cli.biometano_charts import save_biometano_charts
             console.print(f"[dim]Saving charts to: {charts_dir}[/dim]")
             files = save_biometano_charts(projections, valuation, charts_dir)
             console.print(f"[green]✓ Saved {len(files)} chart files[/green]")
@@ -331,6 +338,11 @@ def sens(
     Default methodology: Enterprise Value (FCFF/WACC).
     Produces tornado chart and scenario comparison.
     """
+    from dcf_projects.biometano.builder import build_projections
+    from dcf_projects.biometano.sensitivities import run_sensitivity_analysis
+    from dcf_projects.biometano.valuation import compute_valuation
+    from dcf_ui_cli.biometano_display import display_scenario_comparison, display_sensitivity_tornado
+
     try:
         input_file = _resolve_input_file(input_file, input_option)
         console.print(f"[dim]Loading case: {input_file}[/dim]")
@@ -423,6 +435,14 @@ def report(
     10. Sensitivity Analysis
     11. Scenario Comparison
     """
+    from dcf_projects.biometano.builder import build_projections
+    from dcf_projects.biometano.inputs_recap import display_inputs_recap
+    from dcf_projects.biometano.sensitivities import run_sensitivity_analysis
+    from dcf_projects.biometano.statements import build_statements
+    from dcf_projects.biometano.valuation import compute_valuation
+    from dcf_ui_cli.biometano_display import display_all_biometano, display_incentives_waterfall
+    from dcf_io.writers import export_csv_biometano, export_xlsx_biometano
+
     try:
         input_file = _resolve_input_file(input_file, input_option)
         console.print(f"[dim]Loading case: {input_file}[/dim]")
@@ -481,6 +501,7 @@ def report(
         
         # Charts (no valuation waterfall, no bridge)
         charts_dir = output_dir / "charts"
+        from dcf_ui_cli.biometano_charts import save_biometano_charts
         files = save_biometano_charts(projections, valuation, charts_dir, sensitivity)
         console.print(f"[green]✓ Saved {len(files)} charts to: {charts_dir}[/green]")
         
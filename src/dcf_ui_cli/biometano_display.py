@@ -17,9 +17,18 @@ Section ordering:
 """
 from __future__ import annotations
 
-from typing import Optional
-
-from rich.console import Console
+import io
+import os
+import sys
+from bisect import bisect_left
+from functools import lru_cache
+from operator import attrgetter
+from typing import Iterable, Optional, Sequence, TextIO, TypeVar
+
+import numpy as np
+
+from rich.console import Group, RenderableType
+from rich.rule import Rule
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
@@ -30,41 +39,270 @@ from dcf_projects.biometano.statements import FinancialStatements
 from dcf_projects.biometano.valuation import ValuationOutputs
 from dcf_projects.biometano.sensitivities import SensitivityAnalysisOutputs
 from dcf_projects.biometano.schema import REVENUE_CHANNEL_ORDER
-from dcf_projects.biometano.incentives_allocation import IncentiveAllocationResult
+from dcf_projects.biometano.incentives_allocation import IncentiveAllocationResult, ZesEligibility
+from dcf_ui_cli._console import make_console, single_write
+
+
+console = make_console()
+
+# Headless sweeps set BIOMETANO_CLI_QUIET=1 to turn every display into a no-op
+# before any table or string is built.
+_QUIET = os.environ.get("BIOMETANO_CLI_QUIET", "") not in ("", "0")
+
+# Cell formatters shared by the yearly tables. Values repeat heavily across
+# years (flat availability, zero pre-COD lines, constant fixed costs), so the
+# formatted strings are memoized. Adding 0.0 folds -0.0 into 0.0, which hash
+# alike, so the cached text does not depend on which one was seen first.
+@lru_cache(maxsize=512)
+def _fmt_amount(value: float) -> str:
+    return f"{value + 0.0:,.0f}"
+
+
+@lru_cache(maxsize=512)
+def _fmt_outflow(value: float) -> str:
+    return f"({value + 0.0:,.0f})"
+
+
+@lru_cache(maxsize=64)
+def _fmt_pct(value: float) -> str:
+    return f"{value + 0.0:.0%}"
+
+
+# Balance check cell keyed by "balanced" (|check| < 1).
+_BALANCE_CHECK_CELL = {True: "[green]✓[/green]", False: "[red]⚠[/red]"}
+
+_ZES_ELIGIBILITY_STYLE = {
+    ZesEligibility.ELIGIBLE: "green",
+    ZesEligibility.PARTIAL: "yellow",
+    ZesEligibility.NOT_ELIGIBLE: "red",
+}
+_ZES_ELIGIBILITY_CELL = {
+    status: f"[{style}]{status.value}[/{style}]"
+    for status, style in _ZES_ELIGIBILITY_STYLE.items()
+}
+
+
+def _eur_or_dash(value: float) -> str:
+    """Format a positive euro amount, or "-" when there is nothing to show."""
+    return f"€{value:,.0f}" if value > 0 else "-"
+
+
+_T = TypeVar("_T")
+_year_of = attrgetter("year")
+
+_ROUNDED = box.ROUNDED
+
+# Separator cells for the incentives waterfall tables.
+_SEP_10 = "─" * 10
+_SEP_12 = "─" * 12
+_SEP_15 = "─" * 15
+_SEP_20 = "─" * 20
+_SEP_25 = "─" * 25
+
+# Column specs: (header, justify) or (header, justify, style).
+_ColumnSpec = tuple[tuple[str, ...], ...]
+
+_PRODUCTION_COLUMNS: _ColumnSpec = (
+    ("Year", "center"),
+    ("Availability", "right"),
+    ("FORSU (t)", "right"),
+    ("Biomethane (MWh)", "right"),
+    ("CO₂ (t)", "right"),
+    ("Compost (t)", "right"),
+)
+_REVENUE_COLUMNS: _ColumnSpec = (
+    ("Year", "center"),
+    ("Gate Fee", "right"),
+    ("Tariff", "right"),
+    ("GO", "right"),
+    ("CO₂", "right"),
+    ("Compost", "right"),
+    ("Total", "right", "bold"),
+)
+_OPEX_COLUMNS: _ColumnSpec = (
+    ("Year", "center"),
+    ("Feedstock", "right"),
+    ("Utilities", "right"),
+    ("Maintenance", "right"),
+    ("Personnel", "right"),
+    ("Other", "right"),
+    ("Total", "right", "bold"),
+)
+_INCOME_STATEMENT_COLUMNS: _ColumnSpec = (
+    ("Year", "center"),
+    ("Revenue", "right"),
+    ("OPEX", "right"),
+    ("EBITDA", "right"),
+    ("D&A", "right"),
+    ("EBIT", "right"),
+    ("Interest", "right"),
+    ("EBT", "right"),
+    ("Taxes", "right"),
+    ("Net Income", "right", "bold"),
+)
+_DISCOUNTING_COLUMNS: _ColumnSpec = (
+    ("Year", "center"),
+    ("WACC", "right"),
+    ("FCFF", "right"),
+    ("PV(FCFF)", "right", "bold"),
+)
+_METRIC_VALUE_COLUMNS: _ColumnSpec = (
+    ("Metric", "left"),
+    ("Value", "right"),
+)
+_BALANCE_SHEET_COLUMNS: _ColumnSpec = (
+    ("Year", "center"),
+    ("Fixed Assets", "right"),
+    ("Curr Assets", "right"),
+    ("ZES Credit", "right"),
+    ("Total Assets", "right", "bold"),
+    ("Debt", "right"),
+    ("Def. Income", "right"),
+    ("Equity", "right"),
+    ("Check", "center"),
+)
+_FCFF_COLUMNS: _ColumnSpec = (
+    ("Year", "center"),
+    ("EBIT", "right"),
+    ("Tax on EBIT", "right"),
+    ("NOPAT", "right"),
+    ("+D&A", "right"),
+    ("-ΔNWC", "right"),
+    ("-CAPEX", "right"),
+    ("FCFF", "right", "bold"),
+)
+_TORNADO_COLUMNS: _ColumnSpec = (
+    ("Parameter", "left"),
+    ("Low Shock", "center"),
+    ("Low EV", "right"),
+    ("High Shock", "center"),
+    ("High EV", "right"),
+    ("Spread", "right", "bold"),
+)
+_INCENTIVES_SUMMARY_COLUMNS: _ColumnSpec = (
+    ("Incentive", "left"),
+    ("Amount", "right"),
+    ("Status", "center"),
+)
+_PNRR_COLUMNS: _ColumnSpec = (
+    ("Parameter", "left", "cyan"),
+    ("Value", "right"),
+)
+_ITEM_VALUE_COLUMNS: _ColumnSpec = (
+    ("Item", "left", "cyan"),
+    ("Value", "right"),
+)
+_ZES_ALLOCATION_COLUMNS: _ColumnSpec = (
+    ("CAPEX Line", "left", "cyan"),
+    ("Amount", "right"),
+    ("ZES Eligible", "center"),
+    ("From Over-Cap", "right"),
+    ("From Overlap", "right"),
+    ("Total Allocated", "right"),
+)
+_COMPLIANCE_COLUMNS: _ColumnSpec = (
+    ("Check", "left", "cyan"),
+    ("Value", "center"),
+    ("Status", "center"),
+)
+
+
+def _add_columns(table: Table, spec: _ColumnSpec) -> None:
+    """Add every column described by ``spec`` to ``table``."""
+    add_column = table.add_column
+    for header, justify, *style in spec:
+        add_column(header, justify=justify, style=style[0] if style else None)
+
+
+def _make_table(
+    title: str,
+    header_style: str,
+    columns: _ColumnSpec,
+    rows: Iterable[Sequence[str]] = (),
+) -> Table:
+    """Create a rounded-box table with the given columns and optional rows."""
+    table = Table(title=title, box=_ROUNDED, show_header=True, header_style=header_style)
+    _add_columns(table, columns)
+    add_row = table.add_row
+    for row in rows:
+        add_row(*row)
+    return table
+
+
+def _op_slice(seq: Sequence[_T], cod_year: int) -> Sequence[_T]:
+    """Return the operating-phase tail of a year-sorted sequence."""
+    return seq[bisect_left(seq, cod_year, key=_year_of):]
+
+
+def _plain(cell: object) -> str:
+    """Cell text with any Rich markup stripped."""
+    text = str(cell)
+    return Text.from_markup(text).plain if "[" in text else text
+
+
+def _plain_lines(table: Table) -> list[str]:
+    """Title, header and rows of a table as tab-separated plain text."""
+    columns = table.columns
+    lines = [_plain(table.title)] if table.title else []
+    lines.append("\t".join(_plain(column.header) for column in columns))
+    lines.extend(
+        "\t".join(map(_plain, cells))
+        for cells in zip(*(column.cells for column in columns))
+    )
+    return lines
+
+
+def _print_table(table: Table) -> None:
+    """Print a table followed by a blank line.
+    
+    When the console is not a terminal (piped to a file or CI log) the table
+    is written as tab-separated text, skipping Rich's width measurement and
+    box rendering entirely.
+    """
+    if console.is_terminal:
+        console.print(table)
+    else:
+        console.out("\n".join(_plain_lines(table)), highlight=False)
+    console.print()
 
 
-console = Console()
+def _production_table(projections: BiometanoProjections) -> Table:
+    rows = [
+        (
+            str(prod.year),
+            _fmt_pct(prod.availability),
+            _fmt_amount(prod.forsu_tonnes),
+            _fmt_amount(prod.biomethane_mwh),
+            _fmt_amount(prod.co2_tonnes),
+            _fmt_amount(prod.compost_tonnes),
+        )
+        for prod in _op_slice(projections.production, projections.cod_year)
+    ]
+    return _make_table("🌿 Production Summary", "bold cyan", _PRODUCTION_COLUMNS, rows)
 
 
 def display_production_summary(projections: BiometanoProjections) -> None:
     """Display production summary table."""
-    table = Table(
-        title="🌿 Production Summary",
-        box=box.ROUNDED,
-        show_header=True,
-        header_style="bold cyan",
-    )
-    
-    table.add_column("Year", justify="center")
-    table.add_column("Availability", justify="right")
-    table.add_column("FORSU (t)", justify="right")
-    table.add_column("Biomethane (MWh)", justify="right")
-    table.add_column("CO₂ (t)", justify="right")
-    table.add_column("Compost (t)", justify="right")
-    
-    for prod in projections.production:
-        if prod.year >= projections.cod_year:
-            table.add_row(
-                str(prod.year),
-                f"{prod.availability:.0%}",
-                f"{prod.forsu_tonnes:,.0f}",
-                f"{prod.biomethane_mwh:,.0f}",
-                f"{prod.co2_tonnes:,.0f}",
-                f"{prod.compost_tonnes:,.0f}",
-            )
-    
-    console.print(table)
-    console.print()
+    if _QUIET:
+        return
+    _print_table(_production_table(projections))
+
+
+def _revenue_table(projections: BiometanoProjections) -> Table:
+    # Correct column order per requirements
+    rows = [
+        (
+            str(rev.year),
+            _fmt_amount(rev.gate_fee),
+            _fmt_amount(rev.tariff),
+            _fmt_amount(rev.go),
+            _fmt_amount(rev.co2),
+            _fmt_amount(rev.compost),
+            _fmt_amount(rev.total),
+        )
+        for rev in _op_slice(projections.revenues, projections.cod_year)
+    ]
+    return _make_table("💰 Revenue by Channel", "bold green", _REVENUE_COLUMNS, rows)
 
 
 def display_revenue_breakdown(projections: BiometanoProjections) -> None:
@@ -72,70 +310,54 @@ def display_revenue_breakdown(projections: BiometanoProjections) -> None:
     
     Order: Gate Fee, Tariff, GO, CO₂, Compost, Total
     """
-    table = Table(
-        title="💰 Revenue by Channel",
-        box=box.ROUNDED,
-        show_header=True,
-        header_style="bold green",
-    )
-    
-    # Correct column order per requirements
-    table.add_column("Year", justify="center")
-    table.add_column("Gate Fee", justify="right")
-    table.add_column("Tariff", justify="right")
-    table.add_column("GO", justify="right")
-    table.add_column("CO₂", justify="right")
-    table.add_column("Compost", justify="right")
-    table.add_column("Total", justify="right", style="bold")
-    
-    for rev in projections.revenues:
-        if rev.year >= projections.cod_year:
-            table.add_row(
-                str(rev.year),
-                f"{rev.gate_fee:,.0f}",
-                f"{rev.tariff:,.0f}",
-                f"{rev.go:,.0f}",
-                f"{rev.co2:,.0f}",
-                f"{rev.compost:,.0f}",
-                f"{rev.total:,.0f}",
-            )
-    
-    console.print(table)
-    console.print()
+    if _QUIET:
+        return
+    _print_table(_revenue_table(projections))
+
+
+def _opex_table(projections: BiometanoProjections) -> Table:
+    rows = [
+        (
+            str(opex.year),
+            _fmt_amount(opex.feedstock_handling),
+            _fmt_amount(opex.utilities),
+            _fmt_amount(opex.maintenance),
+            _fmt_amount(opex.personnel),
+            _fmt_amount(opex.chemicals + opex.insurance + opex.overheads + opex.digestate_handling + opex.other),
+            _fmt_amount(opex.total),
+        )
+        for opex in _op_slice(projections.opex, projections.cod_year)
+    ]
+    return _make_table("📊 OPEX by Category", "bold red", _OPEX_COLUMNS, rows)
 
 
 def display_opex_breakdown(projections: BiometanoProjections) -> None:
     """Display OPEX by category table."""
-    table = Table(
-        title="📊 OPEX by Category",
-        box=box.ROUNDED,
-        show_header=True,
-        header_style="bold red",
-    )
-    
-    table.add_column("Year", justify="center")
-    table.add_column("Feedstock", justify="right")
-    table.add_column("Utilities", justify="right")
-    table.add_column("Maintenance", justify="right")
-    table.add_column("Personnel", justify="right")
-    table.add_column("Other", justify="right")
-    table.add_column("Total", justify="right", style="bold")
-    
-    for opex in projections.opex:
-        if opex.year >= projections.cod_year:
-            other = opex.chemicals + opex.insurance + opex.overheads + opex.digestate_handling + opex.other
-            table.add_row(
-                str(opex.year),
-                f"{opex.feedstock_handling:,.0f}",
-                f"{opex.utilities:,.0f}",
-                f"{opex.maintenance:,.0f}",
-                f"{opex.personnel:,.0f}",
-                f"{other:,.0f}",
-                f"{opex.total:,.0f}",
-            )
-    
-    console.print(table)
-    console.print()
+    if _QUIET:
+        return
+    _print_table(_opex_table(projections))
+
+
+def _income_statement_table(
+    projections: BiometanoProjections,
+    statements: FinancialStatements,
+) -> Table:
+    rows = [
+        (
+            str(stmt.year),
+            _fmt_amount(stmt.total_revenue),
+            _fmt_outflow(stmt.total_opex),
+            _fmt_amount(stmt.ebitda),
+            _fmt_outflow(stmt.depreciation),
+            _fmt_amount(stmt.ebit),
+            _fmt_outflow(stmt.interest_expense),
+            _fmt_amount(stmt.ebt),
+            _fmt_outflow(stmt.taxes_paid),
+            _fmt_amount(stmt.net_income),
+        )
+        for stmt in _op_slice(statements.income_statements, projections.cod_year)
+    ]
+    return _make_table("📋 Income Statement (Yearly)", "bold yellow", _INCOME_STATEMENT_COLUMNS, rows)
 
 
 def display_income_statement(
@@ -147,41 +369,37 @@ def display_income_statement(
     
     Shows P&L items from Revenue to Net Income.
     """
-    table = Table(
-        title="📋 Income Statement (Yearly)",
-        box=box.ROUNDED,
-        show_header=True,
-        header_style="bold yellow",
-    )
-    
-    table.add_column("Year", justify="center")
-    table.add_column("Revenue", justify="right")
-    table.add_column("OPEX", justify="right")
-    table.add_column("EBITDA", justify="right")
-    table.add_column("D&A", justify="right")
-    table.add_column("EBIT", justify="right")
-    table.add_column("Interest", justify="right")
-    table.add_column("EBT", justify="right")
-    table.add_column("Taxes", justify="right")
-    table.add_column("Net Income", justify="right", style="bold")
-    
-    for stmt in statements.income_statements:
-        if stmt.year >= projections.cod_year:
-            table.add_row(
-                str(stmt.year),
-                f"{stmt.total_revenue:,.0f}",
-                f"({stmt.total_opex:,.0f})",
-                f"{stmt.ebitda:,.0f}",
-                f"({stmt.depreciation:,.0f})",
-                f"{stmt.ebit:,.0f}",
-                f"({stmt.interest_expense:,.0f})",
-                f"{stmt.ebt:,.0f}",
-                f"({stmt.taxes_paid:,.0f})",
-                f"{stmt.net_income:,.0f}",
+    if _QUIET:
+        return
+    _print_table(_income_statement_table(projections, statements))
+
+
+def _discounting_tables(
+    projections: BiometanoProjections,
+    valuation: ValuationOutputs,
+) -> tuple[Table, Table]:
+    table = _make_table("📉 Discounting & PV Schedule (FCFF/WACC)", "bold blue", _DISCOUNTING_COLUMNS)
+    
+    add_row = table.add_row
+    cod = projections.cod_year
+    fcff_of = valuation.fcff.get
+    pv_fcff_of = valuation.pv_fcff.get
+    wacc_of = valuation.wacc.get
+    for year in sorted(valuation.pv_fcff.keys()):
+        if year >= cod:
+            add_row(
+                str(year),
+                f"{wacc_of(year, 0.0):.2%}",
+                f"€{fcff_of(year, 0.0):,.0f}",
+                f"€{pv_fcff_of(year, 0.0):,.0f}",
             )
     
-    console.print(table)
-    console.print()
+    tv_table = _make_table("🏁 Terminal Value (FCFF/WACC)", "bold cyan", _METRIC_VALUE_COLUMNS, [
+        ("Terminal Value", f"€{valuation.terminal_value_fcff:,.0f}"),
+        ("PV(Terminal Value)", f"€{valuation.pv_terminal_value_fcff:,.0f}"),
+        ("Sum PV(FCFF)", f"€{valuation.sum_pv_fcff:,.0f}"),
+    ])
+    return table, tv_table
 
 
 def display_discounting_summary(
@@ -189,76 +407,39 @@ def display_discounting_summary(
     valuation: ValuationOutputs,
 ) -> None:
     """Display discounting schedule + PV + terminal value."""
-    table = Table(
-        title="📉 Discounting & PV Schedule (FCFF/WACC)",
-        box=box.ROUNDED,
-        show_header=True,
-        header_style="bold blue",
-    )
-    
-    table.add_column("Year", justify="center")
-    table.add_column("WACC", justify="right")
-    table.add_column("FCFF", justify="right")
-    table.add_column("PV(FCFF)", justify="right", style="bold")
-    
-    for year in sorted(valuation.pv_fcff.keys()):
-        fcff = valuation.fcff.get(year, 0.0)
-        pv_fcff = valuation.pv_fcff.get(year, 0.0)
-        wacc = valuation.wacc.get(year, 0.0)
-        if year >= projections.cod_year:
-            table.add_row(
-                str(year),
-                f"{wacc:.2%}",
-                f"€{fcff:,.0f}",
-                f"€{pv_fcff:,.0f}",
-            )
-    
-    console.print(table)
-    console.print()
-    
-    tv_table = Table(
-        title="🏁 Terminal Value (FCFF/WACC)",
-        box=box.ROUNDED,
-        show_header=True,
-        header_style="bold cyan",
-    )
-    tv_table.add_column("Metric", justify="left")
-    tv_table.add_column("Value", justify="right")
-    tv_table.add_row("Terminal Value", f"€{valuation.terminal_value_fcff:,.0f}")
-    tv_table.add_row("PV(Terminal Value)", f"€{valuation.pv_terminal_value_fcff:,.0f}")
-    tv_table.add_row("Sum PV(FCFF)", f"€{valuation.sum_pv_fcff:,.0f}")
-    
-    console.print(tv_table)
-    console.print()
+    if _QUIET:
+        return
+    for table in _discounting_tables(projections, valuation):
+        _print_table(table)
 
 
-def display_valuation_summary(valuation: ValuationOutputs, methodology: str = "enterprise") -> None:
-    """Display compact Valuation Summary - replaces Valuation Bridge.
+def _balance_sheet_table(statements: FinancialStatements) -> Table:
+    table = _make_table("📊 Balance Sheet (Yearly)", "bold blue", _BALANCE_SHEET_COLUMNS)
     
-    No bridge waterfall, no commentary - just core valuation metrics.
-    """
-    table = Table(
-        title="🎯 Valuation Summary (FCFF/WACC)",
-        box=box.ROUNDED,
-        show_header=True,
-        header_style="bold cyan",
+    balance_sheets = statements.balance_sheets
+    checks = np.fromiter(
+        (bs.balance_check for bs in balance_sheets),
+        dtype=np.float64,
+        count=len(balance_sheets),
     )
+    balanced_flags = (np.abs(checks) < 1).tolist()
     
-    table.add_column("Metric", justify="left")
-    table.add_column("Value", justify="right")
-    
-    table.add_row("Sum PV(FCFF)", f"€{valuation.sum_pv_fcff:,.0f}")
-    table.add_row("Terminal Value", f"€{valuation.terminal_value_fcff:,.0f}")
-    table.add_row("PV(Terminal Value)", f"€{valuation.pv_terminal_value_fcff:,.0f}")
-    table.add_row("", "")
-    table.add_row("[bold]Enterprise Value (FCFF/WACC)[/bold]", f"[bold]€{valuation.enterprise_value:,.0f}[/bold]")
-    
-    # TV share
-    tv_share = valuation.pv_terminal_value_fcff / valuation.enterprise_value * 100 if valuation.enterprise_value > 0 else 0
-    table.add_row("TV Share of EV", f"{tv_share:.1f}%")
-    
-    console.print(table)
-    console.print()
+    add_row = table.add_row
+    for bs, balanced in zip(balance_sheets, balanced_flags):
+        # Use actual attribute names from BalanceSheetLine
+        add_row(
+            str(bs.year),
+            _fmt_amount(bs.fixed_assets_net),
+            _fmt_amount(bs.total_current_assets),
+            _fmt_amount(bs.tax_credit_receivable),
+            _fmt_amount(bs.total_assets),
+            _fmt_amount(bs.debt),
+            _fmt_amount(bs.deferred_income),
+            _fmt_amount(bs.total_equity),
+            _BALANCE_CHECK_CELL[balanced],
+        )
+    return table
+
 
 def display_balance_sheet_recap(
     statements: FinancialStatements,
@@ -268,102 +449,38 @@ def display_balance_sheet_recap(
     
     Shows key balance sheet items with balance check.
     """
-    table = Table(
-        title="📊 Balance Sheet (Yearly)",
-        box=box.ROUNDED,
-        show_header=True,
-        header_style="bold blue",
-    )
-    
-    table.add_column("Year", justify="center")
-    table.add_column("Fixed Assets", justify="right")
-    table.add_column("Curr Assets", justify="right")
-    table.add_column("ZES Credit", justify="right")
-    table.add_column("Total Assets", justify="right", style="bold")
-    table.add_column("Debt", justify="right")
-    table.add_column("Def. Income", justify="right")
-    table.add_column("Equity", justify="right")
-    table.add_column("Check", justify="center")
-    
-    for bs in statements.balance_sheets:
-        # Use actual attribute names from BalanceSheetLine
-        balanced = abs(bs.balance_check) < 1
-        check_mark = "✓" if balanced else "⚠"
-        check_style = "green" if balanced else "red"
-        
-        table.add_row(
-            str(bs.year),
-            f"{bs.fixed_assets_net:,.0f}",
-            f"{bs.total_current_assets:,.0f}",
-            f"{bs.tax_credit_receivable:,.0f}",
-            f"{bs.total_assets:,.0f}",
-            f"{bs.debt:,.0f}",
-            f"{bs.deferred_income:,.0f}",
-            f"{bs.total_equity:,.0f}",
-            f"[{check_style}]{check_mark}[/{check_style}]",
-        )
-    
-    console.print(table)
-    console.print()
+    if _QUIET:
+        return
+    _print_table(_balance_sheet_table(statements))
 
 
-def display_fcff_schedule(projections: BiometanoProjections, tax_rate: float = 0.24) -> None:
-    """Display FCFF breakdown."""
-    table = Table(
-        title="🔄 Free Cash Flow to Firm (FCFF)",
-        box=box.ROUNDED,
-        show_header=True,
-        header_style="bold magenta",
-    )
-    
-    table.add_column("Year", justify="center")
-    table.add_column("EBIT", justify="right")
-    table.add_column("Tax on EBIT", justify="right")
-    table.add_column("NOPAT", justify="right")
-    table.add_column("+D&A", justify="right")
-    table.add_column("-ΔNWC", justify="right")
-    table.add_column("-CAPEX", justify="right")
-    table.add_column("FCFF", justify="right", style="bold")
-    
-    for year in projections.operating_years:
-        ebit = projections.ebit.get(year, 0.0)
+def _fcff_table(projections: BiometanoProjections, tax_rate: float = 0.24) -> Table:
+    rows = []
+    append = rows.append
+    for year, ebit, da, delta_nwc, capex_total, fcff in zip(*projections.as_fcff_arrays()):
         tax = ebit * tax_rate if ebit > 0 else 0.0
-        nopat = ebit - tax
-        da = projections.depreciation.get(year, 0.0)
-        delta_nwc = projections.delta_nwc.get(year, 0.0)
-        capex = projections.get_capex(year)
-        capex_total = capex.total if capex else 0.0
-        fcff = projections.fcff.get(year, 0.0)
-        
-        table.add_row(
+        append((
             str(year),
-            f"{ebit:,.0f}",
-            f"({tax:,.0f})",
-            f"{nopat:,.0f}",
-            f"{da:,.0f}",
-            f"({delta_nwc:,.0f})",
-            f"({capex_total:,.0f})",
-            f"{fcff:,.0f}",
-        )
-    
-    console.print(table)
-    console.print()
+            _fmt_amount(ebit),
+            _fmt_outflow(tax),
+            _fmt_amount(ebit - tax),
+            _fmt_amount(da),
+            _fmt_outflow(delta_nwc),
+            _fmt_outflow(capex_total),
+            _fmt_amount(fcff),
+        ))
+    return _make_table("🔄 Free Cash Flow to Firm (FCFF)", "bold magenta", _FCFF_COLUMNS, rows)
 
 
-def display_valuation_summary(valuation: ValuationOutputs, methodology: str = "enterprise") -> None:
-    """Display compact Valuation Summary - replaces Valuation Bridge.
-    
-    No bridge waterfall, no commentary - just core valuation metrics.
-    """
-    table = Table(
-        title="🎯 Valuation Summary (FCFF/WACC)",
-        box=box.ROUNDED,
-        show_header=True,
-        header_style="bold cyan",
-    )
-    
-    table.add_column("Metric", justify="left")
-    table.add_column("Value", justify="right")
+def display_fcff_schedule(projections: BiometanoProjections, tax_rate: float = 0.24) -> None:
+    """Display FCFF breakdown."""
+    if _QUIET:
+        return
+    _print_table(_fcff_table(projections, tax_rate))
+
+
+def _valuation_summary_table(valuation: ValuationOutputs, methodology: str = "enterprise") -> Table:
+    table = _make_table("🎯 Valuation Summary (FCFF/WACC)", "bold cyan", _METRIC_VALUE_COLUMNS)
     
     table.add_row("Sum PV(FCFF)", f"€{valuation.sum_pv_fcff:,.0f}")
     table.add_row("Terminal Value", f"€{valuation.terminal_value_fcff:,.0f}")
@@ -380,36 +497,34 @@ def display_valuation_summary(valuation: ValuationOutputs, methodology: str = "e
         table.add_row("", "")
         table.add_row("Net Debt", f"€{valuation.net_debt:,.0f}")
         table.add_row("[bold]Equity Value[/bold]", f"[bold]€{valuation.equity_value:,.0f}[/bold]")
+    return table
+
+
+def display_valuation_summary(valuation: ValuationOutputs, methodology: str = "enterprise") -> None:
+    """Display compact Valuation Summary - replaces Valuation Bridge.
     
-    console.print(table)
-    console.print()
+    No bridge waterfall, no commentary - just core valuation metrics.
+    """
+    if _QUIET:
+        return
+    _print_table(_valuation_summary_table(valuation, methodology))
 
 
-def display_sensitivity_tornado(sensitivity: SensitivityAnalysisOutputs, methodology: str = "enterprise") -> None:
-    """Display sensitivity tornado table for Enterprise Value."""
+def _tornado_table(sensitivity: SensitivityAnalysisOutputs, methodology: str = "enterprise") -> Table:
     value_label = "Enterprise Value" if methodology == "enterprise" else "Equity Value"
     
-    table = Table(
-        title=f"🌪️ Sensitivity Analysis ({value_label})",
-        box=box.ROUNDED,
-        show_header=True,
-        header_style="bold yellow",
-    )
+    table = _make_table(f"🌪️ Sensitivity Analysis ({value_label})", "bold yellow", _TORNADO_COLUMNS)
     
-    table.add_column("Parameter", justify="left")
-    table.add_column("Low Shock", justify="center")
-    table.add_column("Low EV", justify="right")
-    table.add_column("High Shock", justify="center")
-    table.add_column("High EV", justify="right")
-    table.add_column("Spread", justify="right", style="bold")
-    
-    for t in sensitivity.tornado_data[:12]:  # Top 12
-        # Use EV values for tornado display
-        low_val = t.low_ev if methodology == "enterprise" else t.low_value
-        high_val = t.high_ev if methodology == "enterprise" else t.high_value
-        spread = abs(high_val - low_val)
-        
-        table.add_row(
+    top = sensitivity.tornado_data[:12]  # Top 12
+    # Use EV values for tornado display
+    low_attr, high_attr = ("low_ev", "high_ev") if methodology == "enterprise" else ("low_value", "high_value")
+    lows = np.fromiter(map(attrgetter(low_attr), top), dtype=np.float64, count=len(top))
+    highs = np.fromiter(map(attrgetter(high_attr), top), dtype=np.float64, count=len(top))
+    spreads = np.abs(highs - lows)
+    
+    add_row = table.add_row
+    for t, low_val, high_val, spread in zip(top, lows.tolist(), highs.tolist(), spreads.tolist()):
+        add_row(
             t.parameter,
             t.low_label,
             f"€{low_val:,.0f}",
@@ -417,39 +532,45 @@ def display_sensitivity_tornado(sensitivity: SensitivityAnalysisOutputs, methodo
             f"€{high_val:,.0f}",
             f"€{spread:,.0f}",
         )
-    
-    console.print(table)
-    console.print()
+    return table
+
+
+def _tornado_base_line(sensitivity: SensitivityAnalysisOutputs, methodology: str = "enterprise") -> str:
+    value_label = "Enterprise Value" if methodology == "enterprise" else "Equity Value"
+    base_val = sensitivity.base_ev if methodology == "enterprise" else sensitivity.base_equity_value
+    return f"Base {value_label}: €{base_val:,.0f}"
+
+
+def display_sensitivity_tornado(sensitivity: SensitivityAnalysisOutputs, methodology: str = "enterprise") -> None:
+    """Display sensitivity tornado table for Enterprise Value."""
+    if _QUIET:
+        return
+    _print_table(_tornado_table(sensitivity, methodology))
     
     # Base value
-    base_val = sensitivity.base_ev if methodology == "enterprise" else sensitivity.base_equity_value
-    console.print(f"[dim]Base {value_label}: €{base_val:,.0f}[/dim]")
+    console.print(f"[dim]{_tornado_base_line(sensitivity, methodology)}[/dim]")
     console.print()
 
 
-def display_scenario_comparison(sensitivity: SensitivityAnalysisOutputs, methodology: str = "enterprise") -> None:
-    """Display scenario comparison table for EV."""
+def _scenario_table(sensitivity: SensitivityAnalysisOutputs, methodology: str = "enterprise") -> Table:
     value_label = "Enterprise Value" if methodology == "enterprise" else "Equity Value"
     
-    table = Table(
-        title=f"📊 Scenario Comparison ({value_label})",
-        box=box.ROUNDED,
-        show_header=True,
-        header_style="bold green",
-    )
-    
-    table.add_column("Scenario", justify="left")
-    table.add_column(value_label, justify="right")
-    table.add_column("PV(FCFF)", justify="right")
-    table.add_column("PV(TV)", justify="right")
-    table.add_column("TV Share", justify="right")
-    table.add_column("Delta", justify="right")
-    table.add_column("Delta %", justify="right")
+    table = _make_table(f"📊 Scenario Comparison ({value_label})", "bold green", (
+        ("Scenario", "left"),
+        (value_label, "right"),
+        ("PV(FCFF)", "right"),
+        ("PV(TV)", "right"),
+        ("TV Share", "right"),
+        ("Delta", "right"),
+        ("Delta %", "right"),
+    ))
     
+    add_row = table.add_row
+    enterprise = methodology == "enterprise"
     for s in sensitivity.scenarios:
-        val = s.ev if methodology == "enterprise" else s.equity_value
-        delta = s.delta_ev if methodology == "enterprise" else s.delta_from_base
-        delta_pct = s.delta_ev_pct if methodology == "enterprise" else s.delta_pct
+        val = s.ev if enterprise else s.equity_value
+        delta = s.delta_ev if enterprise else s.delta_from_base
+        delta_pct = s.delta_ev_pct if enterprise else s.delta_pct
         
         delta_style = "green" if delta >= 0 else "red"
         
@@ -457,7 +578,7 @@ def display_scenario_comparison(sensitivity: SensitivityAnalysisOutputs, methodo
         pv_tv = getattr(s, 'pv_tv', 0)
         tv_share = pv_tv / val * 100 if val > 0 else 0
         
-        table.add_row(
+        add_row(
             s.name,
             f"€{val:,.0f}",
             f"€{pv_fcff:,.0f}",
@@ -466,28 +587,26 @@ def display_scenario_comparison(sensitivity: SensitivityAnalysisOutputs, methodo
             f"[{delta_style}]{delta:+,.0f}[/{delta_style}]",
             f"[{delta_style}]{delta_pct:+.1%}[/{delta_style}]",
         )
-    
-    console.print(table)
-    console.print()
+    return table
+
+
+def display_scenario_comparison(sensitivity: SensitivityAnalysisOutputs, methodology: str = "enterprise") -> None:
+    """Display scenario comparison table for EV."""
+    if _QUIET:
+        return
+    _print_table(_scenario_table(sensitivity, methodology))
 
 
 def display_incentives_summary(projections: BiometanoProjections) -> None:
     """Display incentives summary."""
+    if _QUIET:
+        return
     if not projections.accounting:
         return
     
     acc = projections.accounting
     
-    table = Table(
-        title="🎁 Incentives Summary",
-        box=box.ROUNDED,
-        show_header=True,
-        header_style="bold green",
-    )
-    
-    table.add_column("Incentive", justify="left")
-    table.add_column("Amount", justify="right")
-    table.add_column("Status", justify="center")
+    table = _make_table("🎁 Incentives Summary", "bold green", _INCENTIVES_SUMMARY_COLUMNS)
     
     if acc.total_grant_amount > 0:
         table.add_row("PNRR Grant", f"€{acc.total_grant_amount:,.0f}", "✓ Active")
@@ -496,8 +615,7 @@ def display_incentives_summary(projections: BiometanoProjections) -> None:
         table.add_row("ZES Tax Credit", f"€{acc.total_tax_credit:,.0f}", "✓ Active")
     
     if acc.total_grant_amount > 0 or acc.total_tax_credit > 0:
-        console.print(table)
-        console.print()
+        _print_table(table)
 
 
 def display_incentives_waterfall(result: IncentiveAllocationResult) -> None:
@@ -510,132 +628,133 @@ def display_incentives_waterfall(result: IncentiveAllocationResult) -> None:
     4. Riparto stress table
     5. Compliance check
     """
-    console.print()
-    console.rule("[bold green]📋 Incentives — Waterfall Allocation & Riparto[/bold green]")
-    console.print()
-    
-    # Table 1: PNRR Eligibility & Grant
-    t1 = Table(title="PNRR Eligibility & Grant", box=box.ROUNDED, header_style="bold green")
-    t1.add_column("Parameter", style="cyan")
-    t1.add_column("Value", justify="right")
-    
-    t1.add_row("Biomethane Smc/h", f"{result.smc_per_hour:,.0f}")
-    t1.add_row("Annual Hours", "8,000")
-    t1.add_row("CS_max Base", f"€{result.cs_max_base:,.0f}/Smc/h")
-    t1.add_row("Inflation Factor", "1.137")
-    t1.add_row("CS_max Adjusted", f"€{result.cs_max_adjusted:,.0f}/Smc/h")
-    t1.add_row("─" * 20, "─" * 15)
-    t1.add_row("Eligible Spend (PNRR)", f"€{result.eligible_spend_pnrr:,.0f}")
-    t1.add_row("Grant Rate", f"{result.grant_rate:.0%}")
-    t1.add_row("[bold]Grant Amount[/bold]", f"[bold]€{result.grant_pnrr:,.0f}[/bold]")
-    t1.add_row("─" * 20, "─" * 15)
-    t1.add_row("Tech Costs Limit (12%)", f"€{result.tech_costs_limit:,.0f}")
-    t1.add_row("Tech Costs Actual", f"€{result.tech_costs_actual:,.0f}")
-    tech_status = "[green]✓ OK[/green]" if not result.tech_costs_warning else "[red]⚠ Over Limit[/red]"
-    t1.add_row("Tech Cost Check", tech_status)
-    
-    console.print(t1)
-    console.print()
-    
-    # Table 2: ESL Cap & ZES Gap
-    t2 = Table(title="ESL Cap & ZES Gap", box=box.ROUNDED, header_style="bold green")
-    t2.add_column("Item", style="cyan")
-    t2.add_column("Value", justify="right")
-    
-    t2.add_row("Total CAPEX", f"€{result.total_capex:,.0f}")
-    t2.add_row("Max ESL Intensity", f"{result.max_esl_intensity:.0%}")
-    t2.add_row("Max Aid Amount", f"€{result.max_aid_amount:,.0f}")
-    t2.add_row("PNRR Grant", f"€{result.grant_pnrr:,.0f}")
-    t2.add_row("─" * 20, "─" * 15)
-    t2.add_row("[bold]Gap (ZES Nominal)[/bold]", f"[bold]€{result.gap_zes_nominal:,.0f}[/bold]")
-    t2.add_row("ZES Rate", f"{result.zes_rate:.0%}")
-    t2.add_row("ZES Base Required", f"€{result.zes_base_required:,.0f}")
-    
-    console.print(t2)
-    console.print()
-    
-    # Table 3: ZES Base Allocation (Line-by-Line)
-    t3 = Table(title="ZES Base Allocation (Waterfall)", box=box.ROUNDED, header_style="bold green")
-    t3.add_column("CAPEX Line", style="cyan")
-    t3.add_column("Amount", justify="right")
-    t3.add_column("ZES Eligible", justify="center")
-    t3.add_column("From Over-Cap", justify="right")
-    t3.add_column("From Overlap", justify="right")
-    t3.add_column("Total Allocated", justify="right")
-    
-    for alloc in result.allocation_details:
-        elig_style = "green" if alloc.zes_eligible.value == "eligible" else ("yellow" if alloc.zes_eligible.value == "partial" else "red")
-        t3.add_row(
-            alloc.line_name,
-            f"€{alloc.line_amount:,.0f}",
-            f"[{elig_style}]{alloc.zes_eligible.value}[/{elig_style}]",
-            f"€{alloc.allocated_from_overcap:,.0f}" if alloc.allocated_from_overcap > 0 else "-",
-            f"€{alloc.allocated_from_overlap:,.0f}" if alloc.allocated_from_overlap > 0 else "-",
-            f"€{alloc.total_allocated:,.0f}" if alloc.total_allocated > 0 else "-",
-        )
-    
-    # Totals row
-    t3.add_row("─" * 15, "─" * 12, "─" * 10, "─" * 12, "─" * 12, "─" * 12)
-    t3.add_row(
-        "[bold]TOTAL[/bold]",
-        f"[bold]€{result.total_capex:,.0f}[/bold]",
-        "",
-        f"[bold]€{result.zes_base_from_overcap:,.0f}[/bold]",
-        f"[bold]€{result.zes_base_from_overlap:,.0f}[/bold]",
-        f"[bold]€{result.zes_base_from_overcap + result.zes_base_from_overlap:,.0f}[/bold]",
-    )
-    
-    console.print(t3)
-    console.print()
-    
-    # Table 4: Riparto Stress
-    t4 = Table(title="Riparto (Nominal vs Cash Benefit)", box=box.ROUNDED, header_style="bold green")
-    t4.add_column("Item", style="cyan")
-    t4.add_column("Value", justify="right")
-    
-    t4.add_row("ZES Nominal Authorized", f"€{result.zes_nominal_authorized:,.0f}")
-    t4.add_row("Riparto Coefficient", f"{result.riparto_coeff:.2%}")
-    t4.add_row("─" * 20, "─" * 15)
-    t4.add_row("[bold green]ZES Cash Benefit[/bold green]", f"[bold green]€{result.zes_cash_benefit:,.0f}[/bold green]")
-    t4.add_row("[red]Benefit Lost[/red]", f"[red]€{result.zes_benefit_lost:,.0f}[/red]")
-    
-    console.print(t4)
-    console.print()
-    
-    # Table 5: Compliance Check
-    t5 = Table(title="Compliance Check", box=box.ROUNDED, header_style="bold green")
-    t5.add_column("Check", style="cyan")
-    t5.add_column("Value", justify="center")
-    t5.add_column("Status", justify="center")
-    
-    intensity_pass = abs(result.nominal_aid_intensity - result.max_esl_intensity) < 0.001
-    t5.add_row(
-        "Nominal Aid Intensity",
-        f"{result.nominal_aid_intensity:.1%}",
-        "[green]✓ PASS[/green]" if intensity_pass else "[red]✗ FAIL[/red]",
-    )
-    t5.add_row(
-        "Connection Excluded from ZES",
-        "Yes" if result.connection_excluded else "No",
-        "[green]✓ PASS[/green]" if result.connection_excluded else "[red]✗ FAIL[/red]",
-    )
-    t5.add_row("─" * 25, "─" * 10, "─" * 12)
-    overall_status = "[bold green]✓ ALL PASS[/bold green]" if result.compliance_pass else "[bold red]✗ FAILED[/bold red]"
-    t5.add_row("[bold]Overall Compliance[/bold]", "", overall_status)
-    
-    console.print(t5)
-    console.print()
+    if _QUIET:
+        return
+    with single_write(console):
+        console.print()
+        console.rule("[bold green]📋 Incentives — Waterfall Allocation & Riparto[/bold green]")
+        console.print()
     
-    # Summary panel
-    total_cash = result.grant_pnrr + result.zes_cash_benefit
-    console.print(Panel(
-        f"[bold]Total Cash Benefit:[/bold] €{total_cash:,.0f}\n"
-        f"  PNRR Grant: €{result.grant_pnrr:,.0f}\n"
-        f"  ZES Cash: €{result.zes_cash_benefit:,.0f}",
-        title="[bold green]💰 Incentives Summary[/bold green]",
-        border_style="green",
-    ))
-    console.print()
+        # Table 1: PNRR Eligibility & Grant
+        tech_status = "[green]✓ OK[/green]" if not result.tech_costs_warning else "[red]⚠ Over Limit[/red]"
+        _print_table(_make_table("PNRR Eligibility & Grant", "bold green", _PNRR_COLUMNS, [
+            ("Biomethane Smc/h", f"{result.smc_per_hour:,.0f}"),
+            ("Annual Hours", "8,000"),
+            ("CS_max Base", f"€{result.cs_max_base:,.0f}/Smc/h"),
+            ("Inflation Factor", "1.137"),
+            ("CS_max Adjusted", f"€{result.cs_max_adjusted:,.0f}/Smc/h"),
+            (_SEP_20, _SEP_15),
+            ("Eligible Spend (PNRR)", f"€{result.eligible_spend_pnrr:,.0f}"),
+            ("Grant Rate", f"{result.grant_rate:.0%}"),
+            ("[bold]Grant Amount[/bold]", f"[bold]€{result.grant_pnrr:,.0f}[/bold]"),
+            (_SEP_20, _SEP_15),
+            ("Tech Costs Limit (12%)", f"€{result.tech_costs_limit:,.0f}"),
+            ("Tech Costs Actual", f"€{result.tech_costs_actual:,.0f}"),
+            ("Tech Cost Check", tech_status),
+        ]))
+        
+        # Table 2: ESL Cap & ZES Gap
+        _print_table(_make_table("ESL Cap & ZES Gap", "bold green", _ITEM_VALUE_COLUMNS, [
+            ("Total CAPEX", f"€{result.total_capex:,.0f}"),
+            ("Max ESL Intensity", f"{result.max_esl_intensity:.0%}"),
+            ("Max Aid Amount", f"€{result.max_aid_amount:,.0f}"),
+            ("PNRR Grant", f"€{result.grant_pnrr:,.0f}"),
+            (_SEP_20, _SEP_15),
+            ("[bold]Gap (ZES Nominal)[/bold]", f"[bold]€{result.gap_zes_nominal:,.0f}[/bold]"),
+            ("ZES Rate", f"{result.zes_rate:.0%}"),
+            ("ZES Base Required", f"€{result.zes_base_required:,.0f}"),
+        ]))
+        
+        # Table 3: ZES Base Allocation (Line-by-Line)
+        allocation_rows = [
+            (
+                alloc.line_name,
+                f"€{alloc.line_amount:,.0f}",
+                _ZES_ELIGIBILITY_CELL[alloc.zes_eligible],
+                _eur_or_dash(alloc.allocated_from_overcap),
+                _eur_or_dash(alloc.allocated_from_overlap),
+                _eur_or_dash(alloc.total_allocated),
+            )
+            for alloc in result.allocation_details
+        ]
+        # Totals row
+        allocation_rows.append((_SEP_15, _SEP_12, _SEP_10, _SEP_12, _SEP_12, _SEP_12))
+        allocation_rows.append((
+            "[bold]TOTAL[/bold]",
+            f"[bold]€{result.total_capex:,.0f}[/bold]",
+            "",
+            f"[bold]€{result.zes_base_from_overcap:,.0f}[/bold]",
+            f"[bold]€{result.zes_base_from_overlap:,.0f}[/bold]",
+            f"[bold]€{result.zes_base_from_overcap + result.zes_base_from_overlap:,.0f}[/bold]",
+        ))
+        _print_table(_make_table(
+            "ZES Base Allocation (Waterfall)", "bold green", _ZES_ALLOCATION_COLUMNS, allocation_rows,
+        ))
+        
+        # Table 4: Riparto Stress
+        _print_table(_make_table("Riparto (Nominal vs Cash Benefit)", "bold green", _ITEM_VALUE_COLUMNS, [
+            ("ZES Nominal Authorized", f"€{result.zes_nominal_authorized:,.0f}"),
+            ("Riparto Coefficient", f"{result.riparto_coeff:.2%}"),
+            (_SEP_20, _SEP_15),
+            ("[bold green]ZES Cash Benefit[/bold green]", f"[bold green]€{result.zes_cash_benefit:,.0f}[/bold green]"),
+            ("[red]Benefit Lost[/red]", f"[red]€{result.zes_benefit_lost:,.0f}[/red]"),
+        ]))
+        
+        # Table 5: Compliance Check
+        intensity_pass = abs(result.nominal_aid_intensity - result.max_esl_intensity) < 0.001
+        overall_status = "[bold green]✓ ALL PASS[/bold green]" if result.compliance_pass else "[bold red]✗ FAILED[/bold red]"
+        _print_table(_make_table("Compliance Check", "bold green", _COMPLIANCE_COLUMNS, [
+            (
+                "Nominal Aid Intensity",
+                f"{result.nominal_aid_intensity:.1%}",
+                "[green]✓ PASS[/green]" if intensity_pass else "[red]✗ FAIL[/red]",
+            ),
+            (
+                "Connection Excluded from ZES",
+                "Yes" if result.connection_excluded else "No",
+                "[green]✓ PASS[/green]" if result.connection_excluded else "[red]✗ FAIL[/red]",
+            ),
+            (_SEP_25, _SEP_10, _SEP_12),
+            ("[bold]Overall Compliance[/bold]", "", overall_status),
+        ]))
+        
+        # Summary panel
+        total_cash = result.grant_pnrr + result.zes_cash_benefit
+        console.print(Panel(
+            f"[bold]Total Cash Benefit:[/bold] €{total_cash:,.0f}\n"
+            f"  PNRR Grant: €{result.grant_pnrr:,.0f}\n"
+            f"  ZES Cash: €{result.zes_cash_benefit:,.0f}",
+            title="[bold green]💰 Incentives Summary[/bold green]",
+            border_style="green",
+        ))
+        console.print()
+
+
+def _build_core_tables(
+    projections: BiometanoProjections,
+    statements: FinancialStatements,
+    valuation: ValuationOutputs,
+    methodology: str,
+) -> list[Table]:
+    """Build the tables for report sections 2-9, in report order."""
+    return [
+        # Section 2: Production
+        _production_table(projections),
+        # Section 3: Revenue (correct column order)
+        _revenue_table(projections),
+        # Section 4: OPEX
+        _opex_table(projections),
+        # Section 5: Income Statement
+        _income_statement_table(projections, statements),
+        # Section 6: Balance Sheet Recap
+        _balance_sheet_table(statements),
+        # Section 7: FCFF Schedule
+        _fcff_table(projections),
+        # Section 8: Discounting + PV + TV
+        *_discounting_tables(projections, valuation),
+        # Section 9: Valuation Summary (no bridge, no commentary)
+        _valuation_summary_table(valuation, methodology),
+    ]
 
 
 def display_all_biometano(
@@ -659,38 +778,72 @@ def display_all_biometano(
     9. Sensitivity Analysis (if provided)
     10. Scenario Comparison (if provided)
     """
-    console.print()
-    console.rule("[bold cyan]Biometano Project Finance Analysis[/bold cyan]")
-    console.print()
-    
-    # Section 2: Production
-    display_production_summary(projections)
-    
-    # Section 3: Revenue (correct column order)
-    display_revenue_breakdown(projections)
-    
-    # Section 4: OPEX
-    display_opex_breakdown(projections)
+    if _QUIET:
+        return
+    if not console.is_terminal:
+        display_all_biometano_fast(
+            projections, statements, valuation, sensitivity, methodology, file=console.file,
+        )
+        return
     
-    # Section 5: Income Statement
-    display_income_statement(projections, statements)
+    renderables: list[RenderableType] = [
+        Text(),
+        Rule("[bold cyan]Biometano Project Finance Analysis[/bold cyan]"),
+        Text(),
+    ]
     
-    # Section 6: Balance Sheet Recap
-    display_balance_sheet_recap(statements, projections)
+    # Sections 2-9
+    for table in _build_core_tables(projections, statements, valuation, methodology):
+        renderables += (table, Text())
     
-    # Section 7: FCFF Schedule
-    display_fcff_schedule(projections)
+    # Section 10 & 11: Sensitivity (if provided)
+    if sensitivity:
+        renderables += (
+            _tornado_table(sensitivity, methodology),
+            Text(),
+            console.render_str(f"[dim]{_tornado_base_line(sensitivity, methodology)}[/dim]"),
+            Text(),
+            _scenario_table(sensitivity, methodology),
+            Text(),
+        )
     
-    # Section 8: Discounting + PV + TV
-    display_discounting_summary(projections, valuation)
+    renderables += (console.render_str("[green]✓ Biometano Analysis Complete[/green]"), Text())
     
-    # Section 9: Valuation Summary (no bridge, no commentary)
-    display_valuation_summary(valuation, methodology)
+    # One print measures the console once for the whole report
+    console.print(Group(*renderables))
+
+
+def display_all_biometano_fast(
+    projections: BiometanoProjections,
+    statements: FinancialStatements,
+    valuation: ValuationOutputs,
+    sensitivity: Optional[SensitivityAnalysisOutputs] = None,
+    methodology: str = "enterprise",
+    file: Optional[TextIO] = None,
+) -> None:
+    """Write the same report as display_all_biometano as plain text.
     
-    # Section 10 & 11: Sensitivity (if provided)
+    Intended for headless batch runs: tables are emitted as tab-separated
+    blocks into one buffer and written with a single call, bypassing Rich's
+    measurement, segment and style rendering. ``display_all_biometano`` uses
+    this automatically when the console is not a terminal.
+    """
+    if _QUIET:
+        return
+    tables = _build_core_tables(projections, statements, valuation, methodology)
+    buffer = io.StringIO()
+    write = buffer.write
+    write("Biometano Project Finance Analysis\n\n")
+    for table in tables:
+        write("\n".join(_plain_lines(table)))
+        write("\n\n")
     if sensitivity:
-        display_sensitivity_tornado(sensitivity, methodology)
-        display_scenario_comparison(sensitivity, methodology)
-    
-    console.print("[green]✓ Biometano Analysis Complete[/green]")
-    console.print()
+        write("\n".join(_plain_lines(_tornado_table(sensitivity, methodology))))
+        write("\n\n")
+        write(_tornado_base_line(sensitivity, methodology))
+        write("\n\n")
+        write("\n".join(_plain_lines(_scenario_table(sensitivity, methodology))))
+        write("\n\n")
+    write("✓ Biometano Analysis Complete\n")
+    (file or sys.stdout).write(buffer.getvalue())
+
@@ -5,15 +5,28 @@ Plotly charts for DCF analysis.
 """
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
-
-import plotly.graph_objects as go
-import plotly.express as px
-import numpy as np
+from typing import TYPE_CHECKING, Optional
 
 from dcf_engine.models import DCFOutputs
 
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+
+_cash_flow_fields = attrgetter("year", "fcff", "fcfe")
+_fmt_amount = "{:,.0f}".format
+
+_BASE_LAYOUT = {"template": "plotly_white"}
+_COLORS = {
+    "fcff": "#2E86AB",
+    "fcfe": "#44AF69",
+    "negative": "#E94F37",
+    "connector": "rgb(63, 63, 63)",
+}
+
 
 def create_waterfall_chart(outputs: DCFOutputs) -> go.Figure:
     """
@@ -21,6 +34,8 @@ def create_waterfall_chart(outputs: DCFOutputs) -> go.Figure:
     
     Shows: PV(Flows) + PV(TV) → EV → Equity
     """
+    import plotly.graph_objects as go
+
     vb = outputs.valuation_bridge
     
     # Waterfall data
@@ -48,19 +63,19 @@ def create_waterfall_chart(outputs: DCFOutputs) -> go.Figure:
         measure=measure,
         x=labels,
         textposition="outside",
-        text=[f"{v:,.0f}" if v != 0 else "" for v in values],
+        text=["" if v == 0 else _fmt_amount(v) for v in values],
         y=values,
-        connector={"line": {"color": "rgb(63, 63, 63)"}},
-        increasing={"marker": {"color": "#2E86AB"}},
-        decreasing={"marker": {"color": "#E94F37"}},
-        totals={"marker": {"color": "#44AF69"}},
+        connector={"line": {"color": _COLORS["connector"]}},
+        increasing={"marker": {"color": _COLORS["fcff"]}},
+        decreasing={"marker": {"color": _COLORS["negative"]}},
+        totals={"marker": {"color": _COLORS["fcfe"]}},
     ))
     
     fig.update_layout(
+        _BASE_LAYOUT,
         title="DCF Valuation Waterfall",
         showlegend=False,
         yaxis_title="Value",
-        template="plotly_white",
         height=500,
     )
     
@@ -73,9 +88,9 @@ def create_cashflow_timeline(outputs: DCFOutputs) -> go.Figure:
     
     Shows FCFF and FCFE by year as bar chart.
     """
-    years = [cf.year for cf in outputs.cash_flows]
-    fcff = [cf.fcff for cf in outputs.cash_flows]
-    fcfe = [cf.fcfe for cf in outputs.cash_flows]
+    import plotly.graph_objects as go
+
+    years, fcff, fcfe = map(list, zip(*map(_cash_flow_fields, outputs.cash_flows)))
     
     fig = go.Figure()
     
@@ -83,8 +98,8 @@ def create_cashflow_timeline(outputs: DCFOutputs) -> go.Figure:
         name="FCFF",
         x=years,
         y=fcff,
-        marker_color="#2E86AB",
-        text=[f"{v:,.0f}" for v in fcff],
+        marker_color=_COLORS["fcff"],
+        text=list(map(_fmt_amount, fcff)),
         textposition="outside",
     ))
     
@@ -92,17 +107,17 @@ def create_cashflow_timeline(outputs: DCFOutputs) -> go.Figure:
         name="FCFE",
         x=years,
         y=fcfe,
-        marker_color="#44AF69",
-        text=[f"{v:,.0f}" for v in fcfe],
+        marker_color=_COLORS["fcfe"],
+        text=list(map(_fmt_amount, fcfe)),
         textposition="outside",
     ))
     
     fig.update_layout(
+        _BASE_LAYOUT,
         title="Free Cash Flow Timeline",
         xaxis_title="Year",
         yaxis_title="Cash Flow",
         barmode="group",
-        template="plotly_white",
         height=400,
         legend=dict(
             orientation="h",
@@ -126,6 +141,9 @@ def create_sensitivity_heatmap(
     
     Shows how Equity Value changes with different assumptions.
     """
+    import numpy as np
+    import plotly.graph_objects as go
+
     # Get base values
     base_wacc = outputs.wacc_details[-1].wacc  # Final year WACC
     base_g = outputs.terminal_value.growth_rate or 0.0
@@ -152,23 +170,15 @@ def create_sensitivity_heatmap(
             base_g + 0.02,
         ]
     
-    # Compute sensitivity matrix
-    equity_values = []
-    for g in growth_range:
-        row = []
-        for wacc in wacc_range:
-            if g >= wacc:
-                row.append(float('inf'))
-            else:
-                if g == 0:
-                    tv = final_fcff / wacc
-                else:
-                    tv = final_fcff * (1 + g) / (wacc - g)
-                pv_tv = tv / ((1 + wacc) ** n_periods)
-                ev = sum_pv_fcff + pv_tv
-                equity = ev - net_debt
-                row.append(equity)
-        equity_values.append(row)
+    # Compute sensitivity matrix (growth rows x WACC columns)
+    W = np.asarray(wacc_range, dtype=np.float64)
+    G = np.asarray(growth_range, dtype=np.float64)[:, None]
+    discount = np.power(1 + W, n_periods)  # depends on WACC only
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tv = final_fcff * (1 + G) / (W - G)  # reduces to final_fcff / W at g = 0
+        equity = sum_pv_fcff + tv / discount - net_debt
+    equity_values = np.where(G >= W, np.inf, equity).tolist()
+    inf = float("inf")
     
     # Create heatmap
     fig = go.Figure(data=go.Heatmap(
@@ -176,17 +186,17 @@ def create_sensitivity_heatmap(
         x=[f"{w:.2%}" for w in wacc_range],
         y=[f"{g:.2%}" for g in growth_range],
         colorscale="RdYlGn",
-        text=[[f"{v:,.0f}" if v != float('inf') else "N/A" for v in row] for row in equity_values],
+        text=[["N/A" if v == inf else _fmt_amount(v) for v in row] for row in equity_values],
         texttemplate="%{text}",
         textfont={"size": 10},
         hovertemplate="WACC: %{x}<br>Growth: %{y}<br>Equity: %{text}<extra></extra>",
     ))
     
     fig.update_layout(
+        _BASE_LAYOUT,
         title="Equity Value Sensitivity: WACC vs Growth Rate",
         xaxis_title="WACC",
         yaxis_title="Growth Rate (g)",
-        template="plotly_white",
         height=400,
     )
     
@@ -197,6 +207,8 @@ def create_pv_composition_pie(outputs: DCFOutputs) -> go.Figure:
     """
     Create pie chart showing PV composition.
     """
+    import plotly.graph_objects as go
+
     vb = outputs.valuation_bridge
     
     labels = ["PV(FCFF Flows)", "PV(Terminal Value)"]
@@ -206,14 +218,14 @@ def create_pv_composition_pie(outputs: DCFOutputs) -> go.Figure:
         labels=labels,
         values=values,
         hole=0.4,
-        marker_colors=["#2E86AB", "#44AF69"],
+        marker_colors=[_COLORS["fcff"], _COLORS["fcfe"]],
         textinfo="percent+label",
         textposition="outside",
     )])
     
     fig.update_layout(
+        _BASE_LAYOUT,
         title="Enterprise Value Composition",
-        template="plotly_white",
         height=400,
         annotations=[dict(
             text=f"EV<br>{vb.enterprise_value:,.0f}",
@@ -251,16 +263,22 @@ def save_charts(
         "sensitivity_heatmap": create_sensitivity_heatmap(outputs),
     }
     
-    created_files = []
-    for name, fig in charts.items():
-        file_path = output_dir / f"{name}.{format}"
-        if format == "html":
-            fig.write_html(str(file_path))
-        else:
+    paths = [output_dir / f"{name}.{format}" for name in charts]
+    
+    if format != "html":
+        # Kaleido drives a single shared renderer process, so static images
+        # are written one at a time
+        for fig, file_path in zip(charts.values(), paths):
             fig.write_image(str(file_path))
-        created_files.append(file_path)
+        return paths
+    
+    def _write_html(fig: go.Figure, file_path: Path) -> None:
+        fig.write_html(str(file_path))
     
-    return created_files
+    # HTML writes are plain file I/O, so overlap them on threads
+    with ThreadPoolExecutor(max_workers=len(charts)) as executor:
+        list(executor.map(_write_html, charts.values(), paths))
+    return paths
 
 
 def show_charts(outputs: DCFOutputs) -> None:
@@ -5,18 +5,18 @@ Typer-based command-line interface for DCF modeling tool.
 """
 from __future__ import annotations
 
+import functools
+import hashlib
+import importlib.metadata
+import os
+import stat
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
 
 import typer
 from rich.console import Console
 
-from dcf_engine.engine import DCFEngine
-from dcf_io.readers import read_input_file
-from dcf_io.writers import export_xlsx, export_csv, export_xlsx_biometano, export_csv_biometano
-from dcf_ui_cli.display import display_all
-from dcf_ui_cli.charts import save_charts, show_charts
-
 
 app = typer.Typer(
     name="dcf",
@@ -35,41 +35,129 @@ except ImportError:
 
 console = Console()
 
+if TYPE_CHECKING:
+    from dcf_engine.models import DCFOutputs
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "dcf"
+
+# Parameters shared by several commands
+_INPUT_ARG = typer.Argument(
+    None,
+    help="Path to input file (YAML or JSON)",
+)
+_INPUT_OPT = typer.Option(
+    None,
+    "--input",
+    "-i",
+    help="Path to input file (YAML or JSON)",
+)
+_XLSX_MODE_OPT = typer.Option(
+    "formulas",
+    "--xlsx-mode",
+    help="Excel export mode: formulas or values",
+)
+_NO_CACHE_OPT = typer.Option(
+    False,
+    "--no-cache",
+    help="Recompute instead of reusing cached results",
+)
+
 
 def _resolve_input_file(input_file: Optional[Path], input_option: Optional[Path]) -> Path:
     """Resolve input file from positional arg or --input option."""
     resolved = input_option or input_file
     if resolved is None:
         raise typer.BadParameter("Missing input file. Provide a positional INPUT_FILE or --input.")
-    if not resolved.exists():
+    try:
+        mode = resolved.stat().st_mode  # one syscall for both checks
+    except (FileNotFoundError, NotADirectoryError):
         raise typer.BadParameter(f"Input file not found: {resolved}")
-    if not resolved.is_file():
+    if not stat.S_ISREG(mode):
         raise typer.BadParameter(f"Input path is not a file: {resolved}")
     return resolved
 
 
+def _cache_key(path: Path) -> str:
+    """Hash the input file together with the tool version and engine sources."""
+    import dcf_engine
+    import dcf_io.readers
+
+    digest = hashlib.blake2b(path.read_bytes(), digest_size=16)
+    try:
+        digest.update(importlib.metadata.version("dcf-modeling-tool").encode())
+    except importlib.metadata.PackageNotFoundError:
+        pass
+    sources = sorted(Path(dcf_engine.__file__).parent.glob("*.py"))
+    sources.append(Path(dcf_io.readers.__file__))
+    for source in sources:
+        info = source.stat()
+        digest.update(f"{source.name}:{info.st_mtime_ns}:{info.st_size}".encode())
+    return digest.hexdigest()
+
+
+def _cached_outputs(path: Path, use_cache: bool = True) -> DCFOutputs:
+    """Read inputs and run the engine, memoizing the outputs on disk as JSON."""
+    from pydantic import ValidationError
+
+    from dcf_engine.engine import DCFEngine
+    from dcf_engine.models import DCFOutputs
+    from dcf_io.readers import read_input_file
+
+    cache_file = _CACHE_DIR / f"{_cache_key(path)}.json" if use_cache else None
+    if cache_file is not None:
+        try:
+            return DCFOutputs.model_validate_json(cache_file.read_bytes())
+        except OSError:
+            pass  # No usable entry: recompute and write it
+        except (ValueError, ValidationError):
+            # Corrupt or stale entry: drop it and recompute
+            try:
+                cache_file.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    outputs = DCFEngine(read_input_file(path)).run()
+
+    if cache_file is not None:
+        try:
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp_file.write_text(outputs.model_dump_json(), encoding="utf-8")
+            tmp_file.replace(cache_file)
+        except OSError:
+            pass  # Caching is best effort
+    return outputs
+
+
+def _cli_guard(prefix: str = "Error") -> Callable[[F], F]:
+    """Report any exception raised by a command and exit with status 1."""
+    def decorator(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return fn(*args, **kwargs)
+            except typer.Exit:
+                raise  # The command already reported the failure
+            except Exception as e:
+                console.print(f"[red]{prefix}: {e}[/red]")
+                raise typer.Exit(code=1)
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
+
 @app.command()
+@_cli_guard()
 def run(
-    input_file: Optional[Path] = typer.Argument(
-        None,
-        help="Path to input file (YAML or JSON)",
-    ),
-    input_option: Optional[Path] = typer.Option(
-        None,
-        "--input",
-        "-i",
-        help="Path to input file (YAML or JSON)",
-    ),
+    input_file: Optional[Path] = _INPUT_ARG,
+    input_option: Optional[Path] = _INPUT_OPT,
     output: Optional[Path] = typer.Option(
         None,
         "--output", "-o",
         help="Output Excel file path",
     ),
-    xlsx_mode: str = typer.Option(
-        "formulas",
-        "--xlsx-mode",
-        help="Excel export mode: formulas or values",
-    ),
+    xlsx_mode: str = _XLSX_MODE_OPT,
     csv_dir: Optional[Path] = typer.Option(
         None,
         "--csv-dir",
@@ -90,6 +178,7 @@ def run(
         "--quiet", "-q",
         help="Suppress table output",
     ),
+    no_cache: bool = _NO_CACHE_OPT,
 ) -> None:
     """
     Run DCF analysis on an input file.
@@ -98,110 +187,106 @@ def run(
     and displays results as rich tables. Optionally exports to Excel/CSV
     and generates charts.
     """
-    try:
-        input_file = _resolve_input_file(input_file, input_option)
-        # Read inputs
-        console.print(f"[dim]Reading input file: {input_file}[/dim]")
-        inputs = read_input_file(input_file)
-        
-        # Run engine
-        console.print("[dim]Running DCF engine...[/dim]")
-        engine = DCFEngine(inputs)
-        outputs = engine.run()
-        
-        # Display results
-        if not quiet:
-            display_all(outputs)
-        
-        # Export to Excel
+    from dcf_io.writers import export_xlsx, export_csv
+    from dcf_ui_cli.display import display_all
+
+    input_file = _resolve_input_file(input_file, input_option)
+    # Read inputs
+    console.print(f"[dim]Reading input file: {input_file}[/dim]")
+    
+    # Run engine
+    console.print("[dim]Running DCF engine...[/dim]")
+    outputs = _cached_outputs(input_file, use_cache=not no_cache)
+    
+    # Display results
+    if not quiet:
+        display_all(outputs)
+    
+    # Exports only read the outputs, so write them concurrently
+    failed = False
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        jobs: dict[Future[Any], str] = {}
         if output:
             console.print(f"\n[dim]Exporting to Excel: {output}[/dim]")
-            export_xlsx(outputs, output, xlsx_mode=xlsx_mode)
-            console.print(f"[green]✓ Exported to {output}[/green]")
-        
-        # Export to CSV
+            jobs[executor.submit(export_xlsx, outputs, output, xlsx_mode=xlsx_mode)] = "xlsx"
+
         if csv_dir:
             console.print(f"\n[dim]Exporting CSVs to: {csv_dir}[/dim]")
-            files = export_csv(outputs, csv_dir)
-            console.print(f"[green]✓ Exported {len(files)} CSV files[/green]")
-        
-        # Charts
-        if charts:
-            console.print("\n[dim]Opening charts in browser...[/dim]")
-            show_charts(outputs)
-        
+            jobs[executor.submit(export_csv, outputs, csv_dir)] = "csv"
+
         if charts_dir:
+            from dcf_ui_cli.charts import save_charts
+
             console.print(f"\n[dim]Saving charts to: {charts_dir}[/dim]")
-            files = save_charts(outputs, charts_dir)
-            console.print(f"[green]✓ Saved {len(files)} chart files[/green]")
-    
-    except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
+            jobs[executor.submit(save_charts, outputs, charts_dir)] = "charts"
+
+        # Report each export as soon as it finishes
+        for job in as_completed(jobs):
+            label = jobs[job]
+            try:
+                result = job.result()
+            except Exception as e:
+                console.print(f"[red]Error ({label} export): {e}[/red]")
+                failed = True
+                continue
+            if label == "xlsx":
+                console.print(f"[green]✓ Exported to {output}[/green]")
+            elif label == "csv":
+                console.print(f"[green]✓ Exported {len(result)} CSV files[/green]")
+            else:
+                console.print(f"[green]✓ Saved {len(result)} chart files[/green]")
+
+    # Charts
+    if charts:
+        from dcf_ui_cli.charts import show_charts
+
+        console.print("\n[dim]Opening charts in browser...[/dim]")
+        show_charts(outputs)
+
+    if failed:
         raise typer.Exit(code=1)
 
 
 @app.command()
+@_cli_guard("Validation failed")
 def validate(
-    input_file: Optional[Path] = typer.Argument(
-        None,
-        help="Path to input file (YAML or JSON)",
-    ),
-    input_option: Optional[Path] = typer.Option(
-        None,
-        "--input",
-        "-i",
-        help="Path to input file (YAML or JSON)",
-    ),
+    input_file: Optional[Path] = _INPUT_ARG,
+    input_option: Optional[Path] = _INPUT_OPT,
 ) -> None:
     """
     Validate an input file without running the full DCF.
     
     Checks that all required fields are present and consistent.
     """
-    try:
-        input_file = _resolve_input_file(input_file, input_option)
-        console.print(f"[dim]Validating: {input_file}[/dim]")
-        inputs = read_input_file(input_file)
-        
-        # Create engine (which validates inputs)
-        DCFEngine(inputs)
-        
-        console.print("[green]✓ Input file is valid[/green]")
-        
-        # Show summary
-        console.print(f"\n  Base year: {inputs.timeline.base_year}")
-        console.print(f"  Forecast years: {inputs.timeline.forecast_years}")
-        console.print(f"  Discounting mode: {inputs.discounting_mode.value}")
-        console.print(f"  Terminal value method: {inputs.terminal_value.method.value}")
-        console.print(f"  WACC weighting: {inputs.wacc.weighting_mode.value}")
+    from dcf_engine.validation import validate_inputs
+    from dcf_io.readers import read_input_file
+
+    input_file = _resolve_input_file(input_file, input_option)
+    console.print(f"[dim]Validating: {input_file}[/dim]")
+    inputs = read_input_file(input_file)
     
-    except Exception as e:
-        console.print(f"[red]Validation failed: {e}[/red]")
-        raise typer.Exit(code=1)
+    validate_inputs(inputs)
+    
+    console.print("[green]✓ Input file is valid[/green]")
+    
+    # Show summary
+    console.print(f"\n  Base year: {inputs.timeline.base_year}")
+    console.print(f"  Forecast years: {inputs.timeline.forecast_years}")
+    console.print(f"  Discounting mode: {inputs.discounting_mode.value}")
+    console.print(f"  Terminal value method: {inputs.terminal_value.method.value}")
+    console.print(f"  WACC weighting: {inputs.wacc.weighting_mode.value}")
 
 
 @app.command()
 def export(
-    input_file: Optional[Path] = typer.Argument(
-        None,
-        help="Path to input file (YAML or JSON)",
-    ),
-    input_option: Optional[Path] = typer.Option(
-        None,
-        "--input",
-        "-i",
-        help="Path to input file (YAML or JSON)",
-    ),
+    input_file: Optional[Path] = _INPUT_ARG,
+    input_option: Optional[Path] = _INPUT_OPT,
     output: Path = typer.Option(
         ...,
         "--output", "-o",
         help="Output Excel file path",
     ),
-    xlsx_mode: str = typer.Option(
-        "formulas",
-        "--xlsx-mode",
-        help="Excel export mode: formulas or values",
-    ),
+    xlsx_mode: str = _XLSX_MODE_OPT,
     export_format: str = typer.Option(
         "xlsx",
         "--format",
@@ -217,20 +302,21 @@ def export(
         "--charts",
         help="Also save chart files to same directory",
     ),
+    no_cache: bool = _NO_CACHE_OPT,
 ) -> None:
     """
     Run DCF and export results to files.
     
     Primary export is Excel. Optionally also exports CSV and charts.
     """
+    from dcf_io.writers import export_xlsx, export_csv
+
     try:
         input_file = _resolve_input_file(input_file, input_option)
         if export_format.lower() != "xlsx":
             raise typer.BadParameter("Only xlsx export is supported.")
 
-        inputs = read_input_file(input_file)
-        engine = DCFEngine(inputs)
-        outputs = engine.run()
+        outputs = _cached_outputs(input_file, use_cache=not no_cache)
 
         export_xlsx(outputs, output, xlsx_mode=xlsx_mode)
         console.print(f"[green]✓ Exported to {output}[/green]")
@@ -242,6 +328,8 @@ def export(
 
         if include_charts:
             charts_dir = output.parent / "charts"
+            from dcf_ui_cli.charts import save_charts
+
             files = save_charts(outputs, charts_dir)
             console.print(f"[green]✓ Saved {len(files)} chart files to {charts_dir}[/green]")
 
@@ -253,6 +341,7 @@ def export(
             from dcf_projects.biometano.builder import build_projections
             from dcf_projects.biometano.statements import build_statements
             from dcf_projects.biometano.valuation import compute_valuation
+            from dcf_io.writers import export_xlsx_biometano, export_csv_biometano
 
             with open(input_file) as handle:
                 data = yaml.safe_load(handle)
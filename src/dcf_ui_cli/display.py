@@ -5,27 +5,83 @@ Rich table formatting for terminal output.
 """
 from __future__ import annotations
 
-from rich.console import Console
+from operator import attrgetter
+from typing import Callable, Iterable, Sequence
+
+from rich.cells import cell_len
+from rich.console import Group, RenderableType
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
 
 from dcf_engine.models import DCFOutputs
+from dcf_ui_cli._console import make_console, single_write
+
+
+console = make_console()
+
+_fmt_money = "{:,.2f}".format
+_fmt_rate4 = "{:.4f}".format
+_fmt_rate6 = "{:.6f}".format
+
+_discount_fields = attrgetter(
+    "year", "period", "wacc", "discount_factor_wacc", "fcff", "pv_fcff",
+    "ke", "discount_factor_ke", "fcfe", "pv_fcfe",
+)
+_DISCOUNT_FORMATS = (
+    str, str, _fmt_rate6, _fmt_rate6, _fmt_money, _fmt_money,
+    _fmt_rate6, _fmt_rate6, _fmt_money, _fmt_money,
+)
+
+
+def _pin_widths(table: Table, rows: Sequence[Sequence[str]]) -> None:
+    """Fix each column at its content width when the whole table fits.
+    
+    Rich otherwise renders every cell just to measure it. Rows must be plain
+    text; tables wider than the console keep Rich's own wrapping.
+    """
+    widths = [
+        max([cell_len(column.header), *(cell_len(row[index]) for row in rows)])
+        for index, column in enumerate(table.columns)
+    ]
+    # One space of padding on each side of a cell, plus the vertical borders
+    if sum(widths) + 3 * len(widths) + 1 <= console.width:
+        for column, width in zip(table.columns, widths):
+            column.width = width
+
+
+def _add_rows(table: Table, rows: Iterable[Sequence[str]]) -> None:
+    """Append pre-formatted rows to a table."""
+    add_row = table.add_row
+    for row in rows:
+        add_row(*row)
+
+
+def _styled(text: str, style: str) -> Text:
+    """Pre-styled cell, equivalent to "[style]text[/style]" without markup parsing.
+    
+    The style is applied as a span (as markup does) so alignment padding
+    stays unstyled.
+    """
+    return Text.assemble((text, style))
 
 
-console = Console()
+def _header_renderables(title: str) -> tuple[Text, Panel]:
+    return Text(), Panel(Text(title, style="bold white"), style="blue")
 
 
 def display_header(title: str) -> None:
     """Display a section header."""
-    console.print()
-    console.print(Panel(Text(title, style="bold white"), style="blue"))
+    for renderable in _header_renderables(title):
+        console.print(renderable)
 
 
-def display_inputs_summary(outputs: DCFOutputs) -> None:
-    """Display inputs/assumptions summary."""
-    display_header("📊 Inputs Summary")
-    
+def _print_section(build: Callable[[DCFOutputs], Table], outputs: DCFOutputs) -> None:
+    display_header(_SECTION_TITLES[build])
+    console.print(build(outputs))
+
+
+def _inputs_summary_table(outputs: DCFOutputs) -> Table:
     table = Table(show_header=True, header_style="bold cyan")
     table.add_column("Parameter", style="dim")
     table.add_column("Value", justify="right")
@@ -39,13 +95,15 @@ def display_inputs_summary(outputs: DCFOutputs) -> None:
     if outputs.terminal_value.growth_rate is not None:
         table.add_row("Terminal Growth Rate", f"{outputs.terminal_value.growth_rate:.4f}")
     
-    console.print(table)
+    return table
 
 
-def display_projections(outputs: DCFOutputs) -> None:
-    """Display operating projections."""
-    display_header("📈 Operating Projections")
-    
+def display_inputs_summary(outputs: DCFOutputs) -> None:
+    """Display inputs/assumptions summary."""
+    _print_section(_inputs_summary_table, outputs)
+
+
+def _projections_table(outputs: DCFOutputs) -> Table:
     table = Table(show_header=True, header_style="bold cyan")
     table.add_column("Year", justify="center")
     table.add_column("Revenue", justify="right")
@@ -56,44 +114,52 @@ def display_projections(outputs: DCFOutputs) -> None:
     table.add_column("Tax on EBIT", justify="right")
     table.add_column("NOPAT", justify="right")
     
-    for p in outputs.projections:
-        table.add_row(
+    rows = [
+        (
             str(p.year),
-            f"{p.revenue:,.2f}",
-            f"{p.operating_costs:,.2f}",
-            f"{p.ebitda:,.2f}",
-            f"{p.depreciation_amortization:,.2f}",
-            f"{p.ebit:,.2f}",
-            f"{p.tax_on_ebit:,.2f}",
-            f"{p.nopat:,.2f}",
+            _fmt_money(p.revenue),
+            _fmt_money(p.operating_costs),
+            _fmt_money(p.ebitda),
+            _fmt_money(p.depreciation_amortization),
+            _fmt_money(p.ebit),
+            _fmt_money(p.tax_on_ebit),
+            _fmt_money(p.nopat),
         )
+        for p in outputs.projections
+    ]
+    _pin_widths(table, rows)
+    _add_rows(table, rows)
     
-    console.print(table)
+    return table
 
 
-def display_nwc(outputs: DCFOutputs) -> None:
-    """Display NWC schedule."""
-    display_header("💰 Net Working Capital Schedule")
-    
+def display_projections(outputs: DCFOutputs) -> None:
+    """Display operating projections."""
+    _print_section(_projections_table, outputs)
+
+
+def _nwc_table(outputs: DCFOutputs) -> Table:
     table = Table(show_header=True, header_style="bold cyan")
     table.add_column("Year", justify="center")
     table.add_column("NWC", justify="right")
     table.add_column("ΔNWC", justify="right")
     
-    for n in outputs.nwc_schedule:
-        table.add_row(
-            str(n.year),
-            f"{n.nwc:,.2f}",
-            f"{n.delta_nwc:,.2f}",
-        )
+    rows = [
+        (str(n.year), _fmt_money(n.nwc), _fmt_money(n.delta_nwc))
+        for n in outputs.nwc_schedule
+    ]
+    _pin_widths(table, rows)
+    _add_rows(table, rows)
     
-    console.print(table)
+    return table
 
 
-def display_cash_flows(outputs: DCFOutputs) -> None:
-    """Display cash flows."""
-    display_header("💸 Cash Flows")
-    
+def display_nwc(outputs: DCFOutputs) -> None:
+    """Display NWC schedule."""
+    _print_section(_nwc_table, outputs)
+
+
+def _cash_flows_table(outputs: DCFOutputs) -> Table:
     table = Table(show_header=True, header_style="bold cyan")
     table.add_column("Year", justify="center")
     table.add_column("NOPAT", justify="right")
@@ -105,27 +171,32 @@ def display_cash_flows(outputs: DCFOutputs) -> None:
     table.add_column("+ NetBorrow", justify="right")
     table.add_column("= FCFE", justify="right", style="bold blue")
     
-    for cf in outputs.cash_flows:
-        after_tax_int = cf.interest_expense - cf.interest_tax_shield
-        table.add_row(
+    rows = [
+        (
             str(cf.year),
-            f"{cf.nopat:,.2f}",
-            f"{cf.depreciation_amortization:,.2f}",
-            f"{cf.delta_nwc:,.2f}",
-            f"{cf.capex:,.2f}",
-            f"{cf.fcff:,.2f}",
-            f"{after_tax_int:,.2f}",
-            f"{cf.net_borrowing:,.2f}",
-            f"{cf.fcfe:,.2f}",
+            _fmt_money(cf.nopat),
+            _fmt_money(cf.depreciation_amortization),
+            _fmt_money(cf.delta_nwc),
+            _fmt_money(cf.capex),
+            _fmt_money(cf.fcff),
+            _fmt_money(cf.interest_expense - cf.interest_tax_shield),
+            _fmt_money(cf.net_borrowing),
+            _fmt_money(cf.fcfe),
         )
+        for cf in outputs.cash_flows
+    ]
+    _pin_widths(table, rows)
+    _add_rows(table, rows)
     
-    console.print(table)
+    return table
 
 
-def display_wacc_details(outputs: DCFOutputs) -> None:
-    """Display WACC computation details."""
-    display_header("📊 WACC Details")
-    
+def display_cash_flows(outputs: DCFOutputs) -> None:
+    """Display cash flows."""
+    _print_section(_cash_flows_table, outputs)
+
+
+def _wacc_details_table(outputs: DCFOutputs) -> Table:
     table = Table(show_header=True, header_style="bold cyan")
     table.add_column("Year", justify="center")
     table.add_column("Ke", justify="right")
@@ -137,26 +208,32 @@ def display_wacc_details(outputs: DCFOutputs) -> None:
     table.add_column("wE", justify="right")
     table.add_column("WACC", justify="right", style="bold yellow")
     
-    for w in outputs.wacc_details:
-        table.add_row(
+    rows = [
+        (
             str(w.year),
-            f"{w.ke:.4f}",
-            f"{w.rd:.4f}",
-            f"{w.tax_rate:.4f}",
-            f"{w.debt:,.2f}",
-            f"{w.equity_book:,.2f}",
-            f"{w.weight_debt:.4f}",
-            f"{w.weight_equity:.4f}",
+            _fmt_rate4(w.ke),
+            _fmt_rate4(w.rd),
+            _fmt_rate4(w.tax_rate),
+            _fmt_money(w.debt),
+            _fmt_money(w.equity_book),
+            _fmt_rate4(w.weight_debt),
+            _fmt_rate4(w.weight_equity),
             f"{w.wacc:.10f}",
         )
+        for w in outputs.wacc_details
+    ]
+    _pin_widths(table, rows)
+    _add_rows(table, rows)
     
-    console.print(table)
+    return table
 
 
-def display_pv_decomposition(outputs: DCFOutputs) -> None:
-    """Display PV decomposition."""
-    display_header("📉 Present Value Decomposition")
-    
+def display_wacc_details(outputs: DCFOutputs) -> None:
+    """Display WACC computation details."""
+    _print_section(_wacc_details_table, outputs)
+
+
+def _pv_decomposition_table(outputs: DCFOutputs) -> Table:
     table = Table(show_header=True, header_style="bold cyan")
     table.add_column("Year", justify="center")
     table.add_column("Period", justify="center")
@@ -169,39 +246,32 @@ def display_pv_decomposition(outputs: DCFOutputs) -> None:
     table.add_column("FCFE", justify="right")
     table.add_column("PV(FCFE)", justify="right", style="blue")
     
-    total_pv_fcff = 0.0
-    total_pv_fcfe = 0.0
-    
-    for d in outputs.discount_schedule:
-        table.add_row(
-            str(d.year),
-            str(d.period),
-            f"{d.wacc:.6f}",
-            f"{d.discount_factor_wacc:.6f}",
-            f"{d.fcff:,.2f}",
-            f"{d.pv_fcff:,.2f}",
-            f"{d.ke:.6f}",
-            f"{d.discount_factor_ke:.6f}",
-            f"{d.fcfe:,.2f}",
-            f"{d.pv_fcfe:,.2f}",
-        )
-        total_pv_fcff += d.pv_fcff
-        total_pv_fcfe += d.pv_fcfe
+    # Format column by column: one bound formatter mapped over each series
+    columns = zip(*map(_discount_fields, outputs.discount_schedule))
+    rows = list(zip(*(map(fmt, column) for fmt, column in zip(_DISCOUNT_FORMATS, columns))))
     
-    table.add_row(
-        "[bold]Total[/bold]", "", "", "", "",
-        f"[bold]{total_pv_fcff:,.2f}[/bold]",
+    total_pv_fcff = sum(d.pv_fcff for d in outputs.discount_schedule)
+    total_pv_fcfe = sum(d.pv_fcfe for d in outputs.discount_schedule)
+    totals = (
+        "Total", "", "", "", "",
+        _fmt_money(total_pv_fcff),
         "", "", "",
-        f"[bold]{total_pv_fcfe:,.2f}[/bold]",
+        _fmt_money(total_pv_fcfe),
     )
+    _pin_widths(table, [*rows, totals])
+    _add_rows(table, rows)
+    
+    table.add_row(*(f"[bold]{cell}[/bold]" if cell else "" for cell in totals))
     
-    console.print(table)
+    return table
 
 
-def display_terminal_value(outputs: DCFOutputs) -> None:
-    """Display terminal value computation."""
-    display_header("🎯 Terminal Value")
-    
+def display_pv_decomposition(outputs: DCFOutputs) -> None:
+    """Display PV decomposition."""
+    _print_section(_pv_decomposition_table, outputs)
+
+
+def _terminal_value_table(outputs: DCFOutputs) -> Table:
     tv = outputs.terminal_value
     
     table = Table(show_header=True, header_style="bold cyan")
@@ -218,22 +288,24 @@ def display_terminal_value(outputs: DCFOutputs) -> None:
         table.add_row("Exit Metric", tv.exit_metric or "N/A")
     
     table.add_row("", "")
-    table.add_row("[bold]Terminal Value (FCFF)[/bold]", f"[bold green]{tv.terminal_value_fcff:,.2f}[/bold green]")
-    table.add_row("[bold]Terminal Value (FCFE)[/bold]", f"[bold blue]{tv.terminal_value_fcfe:,.2f}[/bold blue]")
+    table.add_row(_styled("Terminal Value (FCFF)", "bold"), _styled(f"{tv.terminal_value_fcff:,.2f}", "bold green"))
+    table.add_row(_styled("Terminal Value (FCFE)", "bold"), _styled(f"{tv.terminal_value_fcfe:,.2f}", "bold blue"))
     table.add_row("", "")
     table.add_row("Discount Rate (WACC)", f"{tv.discount_rate_wacc:.6f}")
     table.add_row("Discount Rate (Ke)", f"{tv.discount_rate_ke:.6f}")
     table.add_row("", "")
-    table.add_row("[bold]PV of TV (FCFF)[/bold]", f"[bold green]{tv.pv_terminal_value_fcff:,.2f}[/bold green]")
-    table.add_row("[bold]PV of TV (FCFE)[/bold]", f"[bold blue]{tv.pv_terminal_value_fcfe:,.2f}[/bold blue]")
+    table.add_row(_styled("PV of TV (FCFF)", "bold"), _styled(f"{tv.pv_terminal_value_fcff:,.2f}", "bold green"))
+    table.add_row(_styled("PV of TV (FCFE)", "bold"), _styled(f"{tv.pv_terminal_value_fcfe:,.2f}", "bold blue"))
     
-    console.print(table)
+    return table
 
 
-def display_valuation_bridge(outputs: DCFOutputs) -> None:
-    """Display valuation bridge."""
-    display_header("🌉 Valuation Bridge")
-    
+def display_terminal_value(outputs: DCFOutputs) -> None:
+    """Display terminal value computation."""
+    _print_section(_terminal_value_table, outputs)
+
+
+def _valuation_bridge_table(outputs: DCFOutputs) -> Table:
     vb = outputs.valuation_bridge
     
     table = Table(show_header=True, header_style="bold cyan")
@@ -244,25 +316,27 @@ def display_valuation_bridge(outputs: DCFOutputs) -> None:
     table.add_row("Sum PV(Cash Flows)", f"{vb.sum_pv_fcff:,.2f}", f"{vb.sum_pv_fcfe:,.2f}")
     table.add_row("+ PV(Terminal Value)", f"{vb.pv_terminal_value_fcff:,.2f}", f"{vb.pv_terminal_value_fcfe:,.2f}")
     table.add_row("", "", "")
-    table.add_row("[bold]Enterprise Value[/bold]", f"[bold]{vb.enterprise_value:,.2f}[/bold]", "-")
+    table.add_row(_styled("Enterprise Value", "bold"), _styled(f"{vb.enterprise_value:,.2f}", "bold"), "-")
     table.add_row("", "", "")
     table.add_row("Less: Debt at Base", f"({vb.debt_at_base:,.2f})", "-")
     table.add_row("Plus: Cash at Base", f"{vb.cash_at_base:,.2f}", "-")
     table.add_row("Net Debt", f"{vb.net_debt:,.2f}", "-")
     table.add_row("", "", "")
     table.add_row(
-        "[bold green]Equity Value[/bold green]",
-        f"[bold green]{vb.equity_value_from_ev:,.2f}[/bold green]",
-        f"[bold blue]{vb.equity_value_direct:,.2f}[/bold blue]",
+        _styled("Equity Value", "bold green"),
+        _styled(f"{vb.equity_value_from_ev:,.2f}", "bold green"),
+        _styled(f"{vb.equity_value_direct:,.2f}", "bold blue"),
     )
     
-    console.print(table)
+    return table
 
 
-def display_reconciliation(outputs: DCFOutputs) -> None:
-    """Display FCFF vs FCFE reconciliation."""
-    display_header("🔄 FCFF vs FCFE Reconciliation")
-    
+def display_valuation_bridge(outputs: DCFOutputs) -> None:
+    """Display valuation bridge."""
+    _print_section(_valuation_bridge_table, outputs)
+
+
+def _reconciliation_table(outputs: DCFOutputs) -> Table:
     vb = outputs.valuation_bridge
     
     table = Table(show_header=True, header_style="bold cyan")
@@ -274,30 +348,52 @@ def display_reconciliation(outputs: DCFOutputs) -> None:
     table.add_row("", "")
     table.add_row("[bold]Difference[/bold]", f"[bold]{vb.reconciliation_difference:,.2f}[/bold]")
     
-    if vb.equity_value_from_ev != 0:
+    # A zero difference (the common case) needs no percentage row
+    if abs(vb.reconciliation_difference) > 1e-9 and vb.equity_value_from_ev != 0:
         pct = abs(vb.reconciliation_difference / vb.equity_value_from_ev * 100)
         table.add_row("Difference (%)", f"{pct:.4f}%")
     
-    console.print(table)
-    
-    # Notes
-    if vb.reconciliation_notes:
-        console.print()
-        for note in vb.reconciliation_notes:
-            console.print(f"  • {note}")
+    return table
+
+
+def _reconciliation_notes(outputs: DCFOutputs) -> list[Text]:
+    notes = outputs.valuation_bridge.reconciliation_notes
+    if not notes:
+        return []
+    return [Text(), *(console.render_str(f"  • {note}") for note in notes)]
+
+
+def display_reconciliation(outputs: DCFOutputs) -> None:
+    """Display FCFF vs FCFE reconciliation."""
+    _print_section(_reconciliation_table, outputs)
+    for note in _reconciliation_notes(outputs):
+        console.print(note)
+
+
+_SECTIONS: tuple[tuple[str, Callable[[DCFOutputs], Table]], ...] = (
+    ("📊 Inputs Summary", _inputs_summary_table),
+    ("📈 Operating Projections", _projections_table),
+    ("💰 Net Working Capital Schedule", _nwc_table),
+    ("💸 Cash Flows", _cash_flows_table),
+    ("📊 WACC Details", _wacc_details_table),
+    ("📉 Present Value Decomposition", _pv_decomposition_table),
+    ("🎯 Terminal Value", _terminal_value_table),
+    ("🌉 Valuation Bridge", _valuation_bridge_table),
+    ("🔄 FCFF vs FCFE Reconciliation", _reconciliation_table),
+)
+_SECTION_TITLES = {build: title for title, build in _SECTIONS}
 
 
 def display_all(outputs: DCFOutputs) -> None:
     """Display all DCF outputs."""
-    display_inputs_summary(outputs)
-    display_projections(outputs)
-    display_nwc(outputs)
-    display_cash_flows(outputs)
-    display_wacc_details(outputs)
-    display_pv_decomposition(outputs)
-    display_terminal_value(outputs)
-    display_valuation_bridge(outputs)
-    display_reconciliation(outputs)
-    
-    console.print()
-    console.print("[bold green]✓ DCF Analysis Complete[/bold green]")
+    renderables: list[RenderableType] = []
+    for title, build in _SECTIONS:
+        renderables.extend(_header_renderables(title))
+        renderables.append(build(outputs))
+    renderables.extend(_reconciliation_notes(outputs))
+    renderables.append(Text())
+    renderables.append(console.render_str("[bold green]✓ DCF Analysis Complete[/bold green]"))
+    
+    # Render every section as one group, emitted with a single write
+    with single_write(console):
+        console.print(Group(*renderables))
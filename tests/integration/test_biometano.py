@@ -3,6 +3,8 @@ Integration Tests for Biometano Module
 
 Tests the complete flow from case YAML to valuation outputs.
 """
+import functools
+
 import pytest
 import yaml
 from pathlib import Path
@@ -17,14 +19,56 @@ from dcf_projects.biometano.sensitivities import run_sensitivity_analysis
 CASE_FILE = Path(__file__).parent.parent.parent / "src/dcf_projects/biometano/case_files/biometano_case.yaml"
 
 
-@pytest.fixture
-def biometano_case():
-    """Load the actual biometano case file."""
+_VALUATIONS: dict[str, tuple[float, float, float, float]] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _load_case() -> BiometanoCase:
     with open(CASE_FILE) as f:
         data = yaml.safe_load(f)
     return BiometanoCase.model_validate(data)
 
 
+def _value_function(case: BiometanoCase) -> tuple[float, float, float, float]:
+    """Sensitivity value function, memoized on the serialized case."""
+    key = case.model_dump_json()
+    if key not in _VALUATIONS:
+        proj = build_projections(case)
+        val = compute_valuation(case, proj)
+        _VALUATIONS[key] = (val.equity_value, val.enterprise_value, val.sum_pv_fcff, val.pv_terminal_value_fcff)
+    return _VALUATIONS[key]
+
+
+@pytest.fixture(scope="session")
+def biometano_case():
+    """Load the actual biometano case file."""
+    return _load_case()
+
+
+@pytest.fixture(scope="session")
+def biometano_projections(biometano_case):
+    """Projections for the case file."""
+    return build_projections(biometano_case)
+
+
+@pytest.fixture(scope="session")
+def biometano_statements(biometano_case, biometano_projections):
+    """Financial statements for the case file."""
+    return build_statements(biometano_case, biometano_projections)
+
+
+@pytest.fixture(scope="session")
+def biometano_valuation(biometano_case, biometano_projections):
+    """Valuation of the case file."""
+    return compute_valuation(biometano_case, biometano_projections)
+
+
+@pytest.fixture(scope="session")
+def sensitivity_result(biometano_case):
+    """Sensitivity analysis of the case file, run once per session."""
+    return run_sensitivity_analysis(biometano_case, value_function=_value_function)
+
+
 class TestFullBiometanoFlow:
     """Integration tests for complete biometano flow."""
     
@@ -37,146 +81,144 @@ class TestFullBiometanoFlow:
         assert biometano_case.horizon.base_year == 2024
         assert biometano_case.production.forsu_throughput_tpy == 60000
     
-    def test_projections_build(self, biometano_case):
+    def test_projections_build(self, biometano_projections):
         """Projections should build successfully."""
-        proj = build_projections(biometano_case)
+        proj = biometano_projections
         
         assert proj is not None
         assert len(proj.production) > 0
         assert len(proj.revenues) > 0
         assert len(proj.opex) > 0
     
-    def test_statements_build(self, biometano_case):
+    def test_statements_build(self, biometano_statements):
         """Financial statements should build successfully."""
-        proj = build_projections(biometano_case)
-        stmts = build_statements(biometano_case, proj)
+        stmts = biometano_statements
         
         assert stmts is not None
         assert len(stmts.income_statements) > 0
         assert len(stmts.balance_sheets) > 0
         assert len(stmts.cash_flows) > 0
     
-    def test_valuation_computes(self, biometano_case):
+    def test_valuation_computes(self, biometano_valuation):
         """Valuation should compute successfully."""
-        proj = build_projections(biometano_case)
-        val = compute_valuation(biometano_case, proj)
+        val = biometano_valuation
         
         assert val is not None
         assert val.enterprise_value > 0
         assert val.equity_value > 0
     
-    def test_enterprise_value_reasonable(self, biometano_case):
+    def test_enterprise_value_reasonable(self, biometano_valuation):
         """EV should be within reasonable range for 60kTPA plant."""
-        proj = build_projections(biometano_case)
-        val = compute_valuation(biometano_case, proj)
+        val = biometano_valuation
         
         # EV should be between 50M and 200M for this size plant
         assert val.enterprise_value > 50_000_000
         assert val.enterprise_value < 200_000_000
     
-    def test_equity_value_less_than_ev(self, biometano_case):
+    def test_equity_value_less_than_ev(self, biometano_valuation):
         """Equity value should be less than EV due to net debt."""
-        proj = build_projections(biometano_case)
-        val = compute_valuation(biometano_case, proj)
+        val = biometano_valuation
         
         # If there's net debt, equity < EV
         if val.net_debt > 0:
             assert val.equity_value < val.enterprise_value
     
-    def test_reconciliation_small(self, biometano_case):
+    def test_reconciliation_small(self, biometano_valuation):
         """FCFF/WACC and FCFE/Ke should reconcile closely."""
-        proj = build_projections(biometano_case)
-        val = compute_valuation(biometano_case, proj)
+        val = biometano_valuation
         
         # Difference should be < 5% of equity value
         recon_pct = abs(val.reconciliation_difference) / val.equity_value if val.equity_value > 0 else 0
         assert recon_pct < 0.10  # 10% tolerance
 
 
-class TestProductionVolumes:
-    """Tests for production volume calculations."""
-    
-    def test_biomethane_output(self, biometano_case):
-        """Biomethane MWh should match input conversion."""
-        proj = build_projections(biometano_case)
-        
-        # From case: 4M Smc * 10 kWh/Smc = 40,000 MWh
-        expected_full_mwh = 40_000
-        
-        # First op year at 75% availability
-        prod_y1 = proj.production[2]  # After 2 construction years
-        assert abs(prod_y1.biomethane_mwh - expected_full_mwh * 0.75) < 100
+# ============================================================================
+# Projection invariants (production volumes, revenue channels, incentives)
+# ============================================================================
+
+def _check_biomethane_output(case, proj):
+    """Biomethane MWh should match input conversion."""
+    # From case: 4M Smc * 10 kWh/Smc = 40,000 MWh
+    expected_full_mwh = 40_000
     
-    def test_byproducts(self, biometano_case):
-        """Byproduct volumes should match input."""
-        proj = build_projections(biometano_case)
-        
-        # At 95% availability (year 3+)
-        for prod in proj.production:
-            if prod.availability == 0.95:
-                assert abs(prod.co2_tonnes - 4560 * 0.95) < 10
-                assert abs(prod.compost_tonnes - 12148 * 0.95) < 10
-                break
+    # First op year at 75% availability
+    prod_y1 = proj.production[2]  # After 2 construction years
+    assert abs(prod_y1.biomethane_mwh - expected_full_mwh * 0.75) < 100
 
 
-class TestRevenueChannels:
-    """Tests for revenue channel calculations."""
-    
-    def test_all_channels_active(self, biometano_case):
-        """All 5 revenue channels should be active."""
-        proj = build_projections(biometano_case)
-        
-        # Check a steady-state year
-        rev = proj.get_revenue(biometano_case.horizon.cod_year + 2)
-        assert rev.gate_fee > 0
-        assert rev.tariff > 0
-        assert rev.co2 > 0
-        assert rev.go > 0
-        assert rev.compost > 0
-    
-    def test_gate_fee_dominant(self, biometano_case):
-        """Gate fee should be largest revenue component."""
-        proj = build_projections(biometano_case)
-        
-        rev = proj.get_revenue(biometano_case.horizon.cod_year + 2)
-        assert rev.gate_fee > rev.tariff
-        assert rev.gate_fee > rev.co2
-        assert rev.gate_fee > rev.compost
+def _check_byproducts(case, proj):
+    """Byproduct volumes should match input."""
+    # At 95% availability (year 3+)
+    for prod in proj.production:
+        if prod.availability == 0.95:
+            assert abs(prod.co2_tonnes - 4560 * 0.95) < 10
+            assert abs(prod.compost_tonnes - 12148 * 0.95) < 10
+            break
+
 
+def _check_all_channels_active(case, proj):
+    """All 5 revenue channels should be active."""
+    # Check a steady-state year
+    rev = proj.get_revenue(case.horizon.cod_year + 2)
+    assert rev.gate_fee > 0
+    assert rev.tariff > 0
+    assert rev.co2 > 0
+    assert rev.go > 0
+    assert rev.compost > 0
 
-class TestIncentivesAccounting:
-    """Tests for incentive accounting."""
+
+def _check_gate_fee_dominant(case, proj):
+    """Gate fee should be largest revenue component."""
+    rev = proj.get_revenue(case.horizon.cod_year + 2)
+    assert rev.gate_fee > rev.tariff
+    assert rev.gate_fee > rev.co2
+    assert rev.gate_fee > rev.compost
+
+
+def _check_grant_calculated(case, proj):
+    """Capital grant should be calculated from eligible CAPEX."""
+    # 40% of eligible CAPEX
+    eligible = case.capex.eligible_for_grant()
+    expected_grant = eligible * 0.40
     
-    def test_grant_calculated(self, biometano_case):
-        """Capital grant should be calculated from eligible CAPEX."""
-        proj = build_projections(biometano_case)
-        
-        # 40% of eligible CAPEX
-        eligible = biometano_case.capex.eligible_for_grant()
-        expected_grant = eligible * 0.40
-        
-        assert proj.accounting is not None
-        assert abs(proj.accounting.total_grant_amount - expected_grant) < 1000
+    assert proj.accounting is not None
+    assert abs(proj.accounting.total_grant_amount - expected_grant) < 1000
+
+
+def _check_tax_credit_calculated(case, proj):
+    """Tax credit should be calculated from CAPEX."""
+    # 14.6189% of total CAPEX (ZES rate)
+    total_capex = case.capex.total_capex()
+    expected_credit = total_capex * 0.146189
     
-    def test_tax_credit_calculated(self, biometano_case):
-        """Tax credit should be calculated from CAPEX."""
-        proj = build_projections(biometano_case)
-        
-        # 14.6189% of total CAPEX (ZES rate)
-        total_capex = biometano_case.capex.total_capex()
-        expected_credit = total_capex * 0.146189
-        
-        assert proj.accounting is not None
-        assert abs(proj.accounting.total_tax_credit - expected_credit) < 1000
+    assert proj.accounting is not None
+    assert abs(proj.accounting.total_tax_credit - expected_credit) < 1000
+
+
+PROJECTION_INVARIANTS = [
+    ("biomethane_output", _check_biomethane_output),
+    ("byproducts", _check_byproducts),
+    ("all_channels_active", _check_all_channels_active),
+    ("gate_fee_dominant", _check_gate_fee_dominant),
+    ("grant_calculated", _check_grant_calculated),
+    ("tax_credit_calculated", _check_tax_credit_calculated),
+]
+
+
+@pytest.mark.parametrize(
+    "name, check", PROJECTION_INVARIANTS, ids=[name for name, _ in PROJECTION_INVARIANTS]
+)
+def test_projection_invariant(biometano_case, biometano_projections, name, check):
+    """Each projection invariant holds for the case file."""
+    check(biometano_case, biometano_projections)
 
 
 class TestStatements:
     """Tests for financial statements."""
     
-    def test_income_statement_format(self, biometano_case):
+    def test_income_statement_format(self, biometano_statements):
         """Income statement should have correct format."""
-        proj = build_projections(biometano_case)
-        stmts = build_statements(biometano_case, proj)
+        stmts = biometano_statements
         
         for is_stmt in stmts.income_statements:
             # EBITDA = Revenue - OPEX
@@ -186,10 +228,9 @@ class TestStatements:
             # EBIT = EBITDA - D&A + Grant release
             # (approximately)
     
-    def test_cash_flow_format(self, biometano_case):
+    def test_cash_flow_format(self, biometano_statements):
         """Cash flow statement should have correct format."""
-        proj = build_projections(biometano_case)
-        stmts = build_statements(biometano_case, proj)
+        stmts = biometano_statements
         
         for cf in stmts.cash_flows:
             # Net CF = CFO + CFI + CFF
@@ -197,30 +238,21 @@ class TestStatements:
             assert abs(cf.net_cash_flow - expected_net) < 1
 
 
+@pytest.mark.xdist_group("biometano_sensitivity")
 class TestSensitivity:
     """Tests for sensitivity analysis."""
     
-    def test_sensitivity_runs(self, biometano_case):
+    def test_sensitivity_runs(self, sensitivity_result):
         """Sensitivity analysis should run without error."""
-        def val_fn(c):
-            proj = build_projections(c)
-            val = compute_valuation(c, proj)
-            return val.equity_value, val.enterprise_value, val.sum_pv_fcff, val.pv_terminal_value_fcff
-        
-        result = run_sensitivity_analysis(biometano_case, value_function=val_fn)
+        result = sensitivity_result
         
         assert result is not None
         assert result.base_equity_value > 0
         assert len(result.tornado_data) > 0
     
-    def test_scenarios_generated(self, biometano_case):
+    def test_scenarios_generated(self, sensitivity_result):
         """Scenarios should be generated."""
-        def val_fn(c):
-            proj = build_projections(c)
-            val = compute_valuation(c, proj)
-            return val.equity_value, val.enterprise_value, val.sum_pv_fcff, val.pv_terminal_value_fcff
-        
-        result = run_sensitivity_analysis(biometano_case, value_function=val_fn)
+        result = sensitivity_result
         
         # Should have Base, Upside, Downside
         assert len(result.scenarios) == 3
@@ -229,14 +261,9 @@ class TestSensitivity:
         assert "Upside" in scenario_names
         assert "Downside" in scenario_names
     
-    def test_upside_better_than_downside(self, biometano_case):
+    def test_upside_better_than_downside(self, sensitivity_result):
         """Upside scenario should have higher value than Downside."""
-        def val_fn(c):
-            proj = build_projections(c)
-            val = compute_valuation(c, proj)
-            return val.equity_value, val.enterprise_value, val.sum_pv_fcff, val.pv_terminal_value_fcff
-        
-        result = run_sensitivity_analysis(biometano_case, value_function=val_fn)
+        result = sensitivity_result
         
         upside = next(s for s in result.scenarios if s.name == "Upside")
         downside = next(s for s in result.scenarios if s.name == "Downside")
@@ -4,6 +4,11 @@ Integration Test - Golden Case
 Full end-to-end test using the embedded golden case inputs and expected outputs.
 All values must match within specified tolerances.
 """
+from functools import partial
+from math import isclose
+from types import MappingProxyType, SimpleNamespace
+
+import numpy as np
 import pytest
 from dcf_engine.engine import DCFEngine
 from dcf_engine.models import (
@@ -33,159 +38,159 @@ from dcf_engine.models import (
 RATE_TOLERANCE = 1e-4      # For rates/percentages
 CURRENCY_TOLERANCE = 1e-2  # For currency values
 
+# Absolute-only comparison for looped checks, matching pytest.approx(abs=...)
+_close = partial(isclose, rel_tol=0.0, abs_tol=CURRENCY_TOLERANCE)
+
 
 # ============================================================================
 # Golden Case Inputs
 # ============================================================================
 
-def create_golden_inputs() -> DCFInputs:
-    """
-    Create the golden case inputs as specified in the requirements.
-    
-    Horizon: t0=2022, forecast 2023-2025 (N=3)
-    Discounting mode: year_specific_flat
-    """
-    return DCFInputs(
-        discounting_mode=DiscountingMode.YEAR_SPECIFIC_FLAT,
-        timeline=TimelineInputs(
-            base_year=2022,
-            forecast_years=[2023, 2024, 2025],
-        ),
-        revenue=RevenueInputs(
-            base_revenue=12500.0,
-            growth_rates={
-                2023: 0.15,
-                2024: 0.10,
-                2025: 0.10,
-            },
-        ),
-        operating=OperatingInputs(
-            cost_ratios={
-                2023: 0.85,
-                2024: 0.83,
-                2025: 0.80,
-            },
-            depreciation_amortization={
-                2022: 500.0,
-                2023: 550.0,
-                2024: 650.0,
-                2025: 700.0,
-            },
-        ),
-        nwc=NWCInputs(
-            nwc_percent={
-                2022: 0.16,
-                2023: 0.16,
-                2024: 0.13,
-                2025: 0.10,
-            },
-        ),
-        investments=InvestmentInputs(
-            capex={
-                2023: 800.0,
-                2024: 900.0,
-                2025: 1000.0,
-            },
-        ),
-        tax=TaxInputs(
-            tax_rate=0.30,
-        ),
-        capm=CAPMInputs(
-            rf=0.04,
-            rm=0.10,
-            beta=1.30,
-        ),
-        debt=DebtInputs(
-            debt_balances={
-                2022: 1500.0,
-                2023: 2050.0,
-                2024: 2055.63,
-                2025: 2039.38,
-            },
-            rd={
-                2022: 0.05,
-                2023: 0.06,
-                2024: 0.065,
-                2025: 0.065,
-            },
+# Horizon: t0=2022, forecast 2023-2025 (N=3)
+# Discounting mode: year_specific_flat
+# Built once at import; tests needing a variant should use model_copy(update=...).
+GOLDEN_INPUTS = DCFInputs(
+    discounting_mode=DiscountingMode.YEAR_SPECIFIC_FLAT,
+    timeline=TimelineInputs(
+        base_year=2022,
+        forecast_years=[2023, 2024, 2025],
+    ),
+    revenue=RevenueInputs(
+        base_revenue=12500.0,
+        growth_rates={
+            2023: 0.15,
+            2024: 0.10,
+            2025: 0.10,
+        },
+    ),
+    operating=OperatingInputs(
+        cost_ratios={
+            2023: 0.85,
+            2024: 0.83,
+            2025: 0.80,
+        },
+        depreciation_amortization={
+            2022: 500.0,
+            2023: 550.0,
+            2024: 650.0,
+            2025: 700.0,
+        },
+    ),
+    nwc=NWCInputs(
+        nwc_percent={
+            2022: 0.16,
+            2023: 0.16,
+            2024: 0.13,
+            2025: 0.10,
+        },
+    ),
+    investments=InvestmentInputs(
+        capex={
+            2023: 800.0,
+            2024: 900.0,
+            2025: 1000.0,
+        },
+    ),
+    tax=TaxInputs(
+        tax_rate=0.30,
+    ),
+    capm=CAPMInputs(
+        rf=0.04,
+        rm=0.10,
+        beta=1.30,
+    ),
+    debt=DebtInputs(
+        debt_balances={
+            2022: 1500.0,
+            2023: 2050.0,
+            2024: 2055.63,
+            2025: 2039.38,
+        },
+        rd={
+            2022: 0.05,
+            2023: 0.06,
+            2024: 0.065,
+            2025: 0.065,
+        },
+    ),
+    wacc=WACCInputs(
+        weighting_mode=WeightingMode.BOOK_VALUE,
+        equity_book_inputs=EquityBookInputs(
+            base_equity_book=10000.0,
+            # Dividends and NewEquity default to 0
         ),
-        wacc=WACCInputs(
-            weighting_mode=WeightingMode.BOOK_VALUE,
-            equity_book_inputs=EquityBookInputs(
-                base_equity_book=10000.0,
-                # Dividends and NewEquity default to 0
-            ),
-        ),
-        terminal_value=TerminalValueInputs(
-            method=TerminalValueMethod.PERPETUITY,
-            g=0.0,  # Zero growth perpetuity
-        ),
-        net_debt=NetDebtInputs(
-            cash_and_equivalents=1492.10,
-        ),
-    )
+    ),
+    terminal_value=TerminalValueInputs(
+        method=TerminalValueMethod.PERPETUITY,
+        g=0.0,  # Zero growth perpetuity
+    ),
+    net_debt=NetDebtInputs(
+        cash_and_equivalents=1492.10,
+    ),
+)
 
 
 # ============================================================================
 # Golden Case Expected Outputs
 # ============================================================================
 
-EXPECTED_REVENUE = {
+# Read-only views, so no test can edit the expectations another test reads.
+EXPECTED_REVENUE = MappingProxyType({
     2023: 14375.0,
     2024: 15812.5,
     2025: 17393.75,
-}
+})
 
-EXPECTED_EBITDA = {
+EXPECTED_EBITDA = MappingProxyType({
     2023: 2156.25,
     2024: 2688.125,
     2025: 3478.75,
-}
+})
 
-EXPECTED_EBIT = {
+EXPECTED_EBIT = MappingProxyType({
     2023: 1606.25,
     2024: 2038.125,
     2025: 2778.75,
-}
+})
 
-EXPECTED_NWC = {
+EXPECTED_NWC = MappingProxyType({
     2022: 2000.0,
     2023: 2300.0,
     2024: 2055.625,
     2025: 1739.375,
-}
+})
 
-EXPECTED_DELTA_NWC = {
+EXPECTED_DELTA_NWC = MappingProxyType({
     2023: 300.0,
     2024: -244.375,
     2025: -316.25,
-}
+})
 
-EXPECTED_TAX_ON_EBIT = {
+EXPECTED_TAX_ON_EBIT = MappingProxyType({
     2023: 481.875,
     2024: 611.4375,
     2025: 833.625,
-}
+})
 
-EXPECTED_FCFF = {
+EXPECTED_FCFF = MappingProxyType({
     2023: 574.375,
     2024: 1421.0625,
     2025: 1961.375,
-}
+})
 
 EXPECTED_KE = 0.118
 
-EXPECTED_WACC = {
+EXPECTED_WACC = MappingProxyType({
     2023: 0.1060962159,
     2024: 0.1076698869,
     2025: 0.1089085817,
-}
+})
 
-EXPECTED_PV_FCFF = {
+EXPECTED_PV_FCFF = MappingProxyType({
     2023: 519.28122685,
     2024: 1158.22378917,
     2025: 1438.37922612,
-}
+})
 
 EXPECTED_SUM_PV_FCFF = 3115.88424214
 
@@ -199,136 +204,63 @@ EXPECTED_NET_DEBT = 7.90
 
 EXPECTED_EQUITY = 16315.20082433
 
+# metric -> (schedule in ctx, attribute, expected values by year, tolerance)
+PER_YEAR_METRICS = MappingProxyType({
+    "revenue": ("proj", "revenue", EXPECTED_REVENUE, CURRENCY_TOLERANCE),
+    "ebitda": ("proj", "ebitda", EXPECTED_EBITDA, CURRENCY_TOLERANCE),
+    "ebit": ("proj", "ebit", EXPECTED_EBIT, CURRENCY_TOLERANCE),
+    "nwc": ("nwc", "nwc", EXPECTED_NWC, CURRENCY_TOLERANCE),
+    "delta_nwc": ("nwc", "delta_nwc", EXPECTED_DELTA_NWC, CURRENCY_TOLERANCE),
+    "tax_on_ebit": ("proj", "tax_on_ebit", EXPECTED_TAX_ON_EBIT, CURRENCY_TOLERANCE),
+    "fcff": ("cf", "fcff", EXPECTED_FCFF, CURRENCY_TOLERANCE),
+    "wacc": ("wacc", "wacc", EXPECTED_WACC, RATE_TOLERANCE),
+    "pv_fcff": ("disc", "pv_fcff", EXPECTED_PV_FCFF, CURRENCY_TOLERANCE),
+})
+
+
+def assert_allclose_by_year(actual_by_year, expected_by_year, years, atol):
+    """Compare a metric across all its years in one vectorised check."""
+    actual = np.array([actual_by_year[y] for y in years], dtype=np.float64)
+    expected = np.array([expected_by_year[y] for y in years], dtype=np.float64)
+    np.testing.assert_allclose(actual, expected, rtol=0, atol=atol, err_msg=f"years {years}")
+
 
 # ============================================================================
 # Integration Tests
 # ============================================================================
 
+@pytest.fixture(scope="session")
+def outputs():
+    """Run the engine once on the golden inputs and return outputs."""
+    return DCFEngine(GOLDEN_INPUTS).run()
+
+
+@pytest.fixture(scope="session")
+def ctx(outputs):
+    """Golden outputs with each per-year schedule indexed by year."""
+    return SimpleNamespace(
+        outputs=outputs,
+        proj=outputs.by_year("projections"),
+        nwc=outputs.by_year("nwc_schedule"),
+        cf=outputs.by_year("cash_flows"),
+        disc=outputs.by_year("discount_schedule"),
+        wacc=outputs.by_year("wacc_details"),
+    )
+
+
 class TestGoldenCase:
     """Full integration test against the golden case."""
     
-    @pytest.fixture
-    def outputs(self):
-        """Run the engine and return outputs."""
-        inputs = create_golden_inputs()
-        engine = DCFEngine(inputs)
-        return engine.run()
-    
     # ========================================================================
-    # Revenue Tests
+    # Per-year Tests
     # ========================================================================
     
-    def test_revenue_2023(self, outputs):
-        proj = next(p for p in outputs.projections if p.year == 2023)
-        assert proj.revenue == pytest.approx(EXPECTED_REVENUE[2023], abs=CURRENCY_TOLERANCE)
-    
-    def test_revenue_2024(self, outputs):
-        proj = next(p for p in outputs.projections if p.year == 2024)
-        assert proj.revenue == pytest.approx(EXPECTED_REVENUE[2024], abs=CURRENCY_TOLERANCE)
-    
-    def test_revenue_2025(self, outputs):
-        proj = next(p for p in outputs.projections if p.year == 2025)
-        assert proj.revenue == pytest.approx(EXPECTED_REVENUE[2025], abs=CURRENCY_TOLERANCE)
-    
-    # ========================================================================
-    # EBITDA Tests
-    # ========================================================================
-    
-    def test_ebitda_2023(self, outputs):
-        proj = next(p for p in outputs.projections if p.year == 2023)
-        assert proj.ebitda == pytest.approx(EXPECTED_EBITDA[2023], abs=CURRENCY_TOLERANCE)
-    
-    def test_ebitda_2024(self, outputs):
-        proj = next(p for p in outputs.projections if p.year == 2024)
-        assert proj.ebitda == pytest.approx(EXPECTED_EBITDA[2024], abs=CURRENCY_TOLERANCE)
-    
-    def test_ebitda_2025(self, outputs):
-        proj = next(p for p in outputs.projections if p.year == 2025)
-        assert proj.ebitda == pytest.approx(EXPECTED_EBITDA[2025], abs=CURRENCY_TOLERANCE)
-    
-    # ========================================================================
-    # EBIT Tests
-    # ========================================================================
-    
-    def test_ebit_2023(self, outputs):
-        proj = next(p for p in outputs.projections if p.year == 2023)
-        assert proj.ebit == pytest.approx(EXPECTED_EBIT[2023], abs=CURRENCY_TOLERANCE)
-    
-    def test_ebit_2024(self, outputs):
-        proj = next(p for p in outputs.projections if p.year == 2024)
-        assert proj.ebit == pytest.approx(EXPECTED_EBIT[2024], abs=CURRENCY_TOLERANCE)
-    
-    def test_ebit_2025(self, outputs):
-        proj = next(p for p in outputs.projections if p.year == 2025)
-        assert proj.ebit == pytest.approx(EXPECTED_EBIT[2025], abs=CURRENCY_TOLERANCE)
-    
-    # ========================================================================
-    # NWC Tests
-    # ========================================================================
-    
-    def test_nwc_2022(self, outputs):
-        nwc = next(n for n in outputs.nwc_schedule if n.year == 2022)
-        assert nwc.nwc == pytest.approx(EXPECTED_NWC[2022], abs=CURRENCY_TOLERANCE)
-    
-    def test_nwc_2023(self, outputs):
-        nwc = next(n for n in outputs.nwc_schedule if n.year == 2023)
-        assert nwc.nwc == pytest.approx(EXPECTED_NWC[2023], abs=CURRENCY_TOLERANCE)
-    
-    def test_nwc_2024(self, outputs):
-        nwc = next(n for n in outputs.nwc_schedule if n.year == 2024)
-        assert nwc.nwc == pytest.approx(EXPECTED_NWC[2024], abs=CURRENCY_TOLERANCE)
-    
-    def test_nwc_2025(self, outputs):
-        nwc = next(n for n in outputs.nwc_schedule if n.year == 2025)
-        assert nwc.nwc == pytest.approx(EXPECTED_NWC[2025], abs=CURRENCY_TOLERANCE)
-    
-    # ========================================================================
-    # ΔNWC Tests
-    # ========================================================================
-    
-    def test_delta_nwc_2023(self, outputs):
-        nwc = next(n for n in outputs.nwc_schedule if n.year == 2023)
-        assert nwc.delta_nwc == pytest.approx(EXPECTED_DELTA_NWC[2023], abs=CURRENCY_TOLERANCE)
-    
-    def test_delta_nwc_2024(self, outputs):
-        nwc = next(n for n in outputs.nwc_schedule if n.year == 2024)
-        assert nwc.delta_nwc == pytest.approx(EXPECTED_DELTA_NWC[2024], abs=CURRENCY_TOLERANCE)
-    
-    def test_delta_nwc_2025(self, outputs):
-        nwc = next(n for n in outputs.nwc_schedule if n.year == 2025)
-        assert nwc.delta_nwc == pytest.approx(EXPECTED_DELTA_NWC[2025], abs=CURRENCY_TOLERANCE)
-    
-    # ========================================================================
-    # Tax on EBIT Tests
-    # ========================================================================
-    
-    def test_tax_on_ebit_2023(self, outputs):
-        proj = next(p for p in outputs.projections if p.year == 2023)
-        assert proj.tax_on_ebit == pytest.approx(EXPECTED_TAX_ON_EBIT[2023], abs=CURRENCY_TOLERANCE)
-    
-    def test_tax_on_ebit_2024(self, outputs):
-        proj = next(p for p in outputs.projections if p.year == 2024)
-        assert proj.tax_on_ebit == pytest.approx(EXPECTED_TAX_ON_EBIT[2024], abs=CURRENCY_TOLERANCE)
-    
-    def test_tax_on_ebit_2025(self, outputs):
-        proj = next(p for p in outputs.projections if p.year == 2025)
-        assert proj.tax_on_ebit == pytest.approx(EXPECTED_TAX_ON_EBIT[2025], abs=CURRENCY_TOLERANCE)
-    
-    # ========================================================================
-    # FCFF Tests
-    # ========================================================================
-    
-    def test_fcff_2023(self, outputs):
-        cf = next(c for c in outputs.cash_flows if c.year == 2023)
-        assert cf.fcff == pytest.approx(EXPECTED_FCFF[2023], abs=CURRENCY_TOLERANCE)
-    
-    def test_fcff_2024(self, outputs):
-        cf = next(c for c in outputs.cash_flows if c.year == 2024)
-        assert cf.fcff == pytest.approx(EXPECTED_FCFF[2024], abs=CURRENCY_TOLERANCE)
-    
-    def test_fcff_2025(self, outputs):
-        cf = next(c for c in outputs.cash_flows if c.year == 2025)
-        assert cf.fcff == pytest.approx(EXPECTED_FCFF[2025], abs=CURRENCY_TOLERANCE)
+    @pytest.mark.parametrize("metric", list(PER_YEAR_METRICS))
+    def test_per_year_metric(self, ctx, metric):
+        schedule, attr, expected, tolerance = PER_YEAR_METRICS[metric]
+        rows = getattr(ctx, schedule)
+        actual = {year: getattr(row, attr) for year, row in rows.items()}
+        assert_allclose_by_year(actual, expected, list(expected), tolerance)
     
     # ========================================================================
     # Ke Test
@@ -337,38 +269,10 @@ class TestGoldenCase:
     def test_ke(self, outputs):
         assert outputs.ke == pytest.approx(EXPECTED_KE, abs=RATE_TOLERANCE)
     
-    # ========================================================================
-    # WACC Tests
-    # ========================================================================
-    
-    def test_wacc_2023(self, outputs):
-        wacc = next(w for w in outputs.wacc_details if w.year == 2023)
-        assert wacc.wacc == pytest.approx(EXPECTED_WACC[2023], abs=RATE_TOLERANCE)
-    
-    def test_wacc_2024(self, outputs):
-        wacc = next(w for w in outputs.wacc_details if w.year == 2024)
-        assert wacc.wacc == pytest.approx(EXPECTED_WACC[2024], abs=RATE_TOLERANCE)
-    
-    def test_wacc_2025(self, outputs):
-        wacc = next(w for w in outputs.wacc_details if w.year == 2025)
-        assert wacc.wacc == pytest.approx(EXPECTED_WACC[2025], abs=RATE_TOLERANCE)
-    
     # ========================================================================
     # PV(FCFF) Tests
     # ========================================================================
     
-    def test_pv_fcff_2023(self, outputs):
-        disc = next(d for d in outputs.discount_schedule if d.year == 2023)
-        assert disc.pv_fcff == pytest.approx(EXPECTED_PV_FCFF[2023], abs=CURRENCY_TOLERANCE)
-    
-    def test_pv_fcff_2024(self, outputs):
-        disc = next(d for d in outputs.discount_schedule if d.year == 2024)
-        assert disc.pv_fcff == pytest.approx(EXPECTED_PV_FCFF[2024], abs=CURRENCY_TOLERANCE)
-    
-    def test_pv_fcff_2025(self, outputs):
-        disc = next(d for d in outputs.discount_schedule if d.year == 2025)
-        assert disc.pv_fcff == pytest.approx(EXPECTED_PV_FCFF[2025], abs=CURRENCY_TOLERANCE)
-    
     def test_sum_pv_fcff(self, outputs):
         assert outputs.valuation_bridge.sum_pv_fcff == pytest.approx(
             EXPECTED_SUM_PV_FCFF, abs=CURRENCY_TOLERANCE
@@ -411,14 +315,14 @@ class TestGoldenCase:
     # Alternative FCFF Calculation Check
     # ========================================================================
     
-    def test_fcff_alternative_formula(self, outputs):
+    def test_fcff_alternative_formula(self, ctx):
         """
         Verify FCFF matches alternative formula:
         FCFF = EBITDA - TaxOnEBIT - ΔNWC - Capex
         """
-        for cf in outputs.cash_flows:
-            proj = next(p for p in outputs.projections if p.year == cf.year)
-            nwc = next(n for n in outputs.nwc_schedule if n.year == cf.year)
+        for cf in ctx.outputs.cash_flows:
+            proj = ctx.proj[cf.year]
+            nwc = ctx.nwc[cf.year]
             
             # Alternative formula
             alt_fcff = (
@@ -428,7 +332,7 @@ class TestGoldenCase:
                 - cf.capex
             )
             
-            assert cf.fcff == pytest.approx(alt_fcff, abs=CURRENCY_TOLERANCE)
+            assert _close(cf.fcff, alt_fcff), (cf.year, cf.fcff, alt_fcff)
 
 
 # ============================================================================
@@ -438,32 +342,13 @@ class TestGoldenCase:
 class TestGoldenCaseValidation:
     """Additional validation tests for the golden case."""
     
-    @pytest.fixture
-    def outputs(self):
-        """Run the engine and return outputs."""
-        inputs = create_golden_inputs()
-        engine = DCFEngine(inputs)
-        return engine.run()
-    
-    def test_discounting_mode_is_year_specific_flat(self, outputs):
-        """Verify the correct discounting mode is used."""
+    def test_outputs_metadata(self, outputs):
+        """Verify discounting mode, horizon and terminal value settings."""
         assert outputs.discounting_mode == DiscountingMode.YEAR_SPECIFIC_FLAT
-    
-    def test_forecast_years(self, outputs):
-        """Verify forecast years match expected."""
         assert outputs.forecast_years == [2023, 2024, 2025]
-    
-    def test_base_year(self, outputs):
-        """Verify base year matches expected."""
         assert outputs.base_year == 2022
-    
-    def test_tv_method_is_perpetuity(self, outputs):
-        """Verify terminal value method."""
         assert outputs.terminal_value.method == TerminalValueMethod.PERPETUITY
-    
-    def test_tv_growth_is_zero(self, outputs):
-        """Verify zero growth rate is used."""
-        assert outputs.terminal_value.growth_rate == 0.0
+        assert outputs.terminal_value.growth_rate == 0.0  # Zero growth perpetuity
 
 
 # ============================================================================
@@ -472,8 +357,7 @@ class TestGoldenCaseValidation:
 
 def test_engine_runs_without_error():
     """Basic smoke test that engine completes without exceptions."""
-    inputs = create_golden_inputs()
-    engine = DCFEngine(inputs)
+    engine = DCFEngine(GOLDEN_INPUTS)
     outputs = engine.run()
     
     assert outputs is not None
@@ -0,0 +1,64 @@
+"""
+Shared fixtures for the unit tests.
+"""
+import pytest
+
+from dcf_engine.models import (
+    DCFInputs,
+    TimelineInputs,
+    RevenueInputs,
+    OperatingInputs,
+    NWCInputs,
+    InvestmentInputs,
+    TaxInputs,
+    CAPMInputs,
+    DebtInputs,
+    WACCInputs,
+    EquityBookInputs,
+    TerminalValueInputs,
+    NetDebtInputs,
+    DiscountingMode,
+    TerminalValueMethod,
+    WeightingMode,
+)
+
+
+@pytest.fixture(scope="session")
+def golden_inputs() -> DCFInputs:
+    """Golden case inputs, built once per session; tests must only read them."""
+    return DCFInputs(
+        timeline=TimelineInputs(
+            base_year=2022,
+            forecast_years=[2023, 2024, 2025],
+        ),
+        revenue=RevenueInputs(
+            base_revenue=12500.0,
+            growth_rates={2023: 0.15, 2024: 0.10, 2025: 0.10},
+        ),
+        operating=OperatingInputs(
+            cost_ratios={2023: 0.85, 2024: 0.83, 2025: 0.80},
+            depreciation_amortization={2022: 500.0, 2023: 550.0, 2024: 650.0, 2025: 700.0},
+        ),
+        nwc=NWCInputs(
+            nwc_percent={2022: 0.16, 2023: 0.16, 2024: 0.13, 2025: 0.10},
+        ),
+        investments=InvestmentInputs(
+            capex={2023: 800.0, 2024: 900.0, 2025: 1000.0},
+        ),
+        tax=TaxInputs(tax_rate=0.30),
+        capm=CAPMInputs(rf=0.04, rm=0.10, beta=1.30),
+        debt=DebtInputs(
+            debt_balances={2022: 1500.0, 2023: 2050.0, 2024: 2055.63, 2025: 2039.38},
+            rd={2022: 0.05, 2023: 0.06, 2024: 0.065, 2025: 0.065},
+        ),
+        wacc=WACCInputs(
+            weighting_mode=WeightingMode.BOOK_VALUE,
+            equity_book_inputs=EquityBookInputs(base_equity_book=10000.0),
+        ),
+        terminal_value=TerminalValueInputs(
+            method=TerminalValueMethod.PERPETUITY,
+            g=0.0,
+        ),
+        net_debt=NetDebtInputs(cash_and_equivalents=1492.10),
+        discounting_mode=DiscountingMode.YEAR_SPECIFIC_FLAT,
+    )
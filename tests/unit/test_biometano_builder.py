@@ -1,17 +1,20 @@
 """
 Unit Tests for Biometano Builder
 """
+import copy
+
 import pytest
 
 from dcf_projects.biometano.schema import BiometanoCase
 from dcf_projects.biometano.builder import (
     BiometanoBuilder,
     BiometanoProjections,
+    YearlyCapex,
     build_projections,
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_case_data():
     """Sample case data for testing."""
     return {
@@ -61,11 +64,36 @@ def sample_case_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_case(sample_case_data):
     return BiometanoCase.model_validate(sample_case_data)
 
 
+@pytest.fixture(scope="module")
+def projections(sample_case):
+    """Projections built once from the sample case; tests only read them."""
+    return build_projections(sample_case)
+
+
+@pytest.fixture(scope="module")
+def case_with_grant(sample_case_data):
+    data = copy.deepcopy(sample_case_data)  # the module fixture is shared
+    data["incentives"] = {
+        "capital_grant": {
+            "enabled": True,
+            "percent_of_eligible": 0.40,
+            "accounting_policy": "A2",
+            "cash_receipt_schedule": [0.5, 0.5],
+        },
+    }
+    return BiometanoCase.model_validate(data)
+
+
+@pytest.fixture(scope="module")
+def projections_with_grant(case_with_grant):
+    return build_projections(case_with_grant)
+
+
 class TestBiometanoBuilder:
     """Tests for BiometanoBuilder."""
     
@@ -77,8 +105,8 @@ class TestBiometanoBuilder:
         assert proj.base_year == 2024
         assert proj.cod_year == 2026
     
-    def test_production_ramp_up(self, sample_case):
-        proj = build_projections(sample_case)
+    def test_production_ramp_up(self, projections):
+        proj = projections
         
         # Operating years (years_forecast = 5 operating years)
         op_years = proj.operating_years
@@ -94,8 +122,8 @@ class TestBiometanoBuilder:
         prod_y2 = next(p for p in proj.production if p.year == 2027)
         assert prod_y2.availability == 0.90
     
-    def test_revenue_calculation(self, sample_case):
-        proj = build_projections(sample_case)
+    def test_revenue_calculation(self, projections):
+        proj = projections
         
         # First operating year
         rev = proj.get_revenue(2026)
@@ -109,15 +137,15 @@ class TestBiometanoBuilder:
         expected_tariff = 40000 * 0.75 * 70
         assert abs(rev.tariff - expected_tariff) < 1
     
-    def test_capex_in_construction_year(self, sample_case):
-        proj = build_projections(sample_case)
+    def test_capex_in_construction_year(self, projections):
+        proj = projections
         
         capex_2025 = proj.get_capex(2025)
         assert capex_2025 is not None
         assert capex_2025.total == 25000000  # 20M EPC + 5M civils
     
-    def test_ebitda_calculation(self, sample_case):
-        proj = build_projections(sample_case)
+    def test_ebitda_calculation(self, projections):
+        proj = projections
         
         # EBITDA in first operating year
         ebitda_2026 = proj.ebitda.get(2026)
@@ -129,20 +157,50 @@ class TestBiometanoBuilder:
         
         assert abs(ebitda_2026 - expected_ebitda) < 1
     
-    def test_fcff_calculation(self, sample_case):
-        proj = build_projections(sample_case)
+    def test_fcff_calculation(self, projections):
+        proj = projections
         
         # FCFF should exist for operating years
         for year in proj.operating_years:
             assert year in proj.fcff
             # FCFF = NOPAT + D&A - ΔNWC - CAPEX
     
-    def test_fcfe_calculation(self, sample_case):
-        proj = build_projections(sample_case)
+    def test_fcfe_calculation(self, projections):
+        proj = projections
         
         # FCFE should exist for operating years
         for year in proj.operating_years:
             assert year in proj.fcfe
+    
+    def test_as_fcff_arrays(self, projections):
+        proj = projections
+        
+        years, ebit, dep, delta_nwc, capex, fcff = proj.as_fcff_arrays()
+        assert years == proj.operating_years
+        for i, year in enumerate(years):
+            assert ebit[i] == proj.ebit.get(year, 0.0)
+            assert dep[i] == proj.depreciation.get(year, 0.0)
+            assert delta_nwc[i] == proj.delta_nwc.get(year, 0.0)
+            capex_line = proj.get_capex(year)
+            assert capex[i] == (capex_line.total if capex_line else 0.0)
+            assert fcff[i] == proj.fcff[year]
+    
+    def test_getters_follow_schedule_updates(self):
+        proj = BiometanoProjections(
+            base_year=2024,
+            cod_year=2025,
+            construction_years=[],
+            operating_years=[2025],
+            all_forecast_years=[2025],
+        )
+        assert proj.get_capex(2025) is None
+        
+        proj.capex.append(YearlyCapex(year=2025, epc=1.0))
+        assert proj.get_capex(2025).epc == 1.0
+        
+        proj.capex = [YearlyCapex(year=2025, epc=2.0), YearlyCapex(year=2025, epc=3.0)]
+        assert proj.get_capex(2025).epc == 2.0  # first match, as before
+        assert proj.capex_by_year() == {2025: proj.get_capex(2025).total}
 
 
 class TestBuildProjectionsConvenience:
@@ -159,20 +217,8 @@ class TestBuildProjectionsConvenience:
 class TestWithIncentives:
     """Tests with incentives enabled."""
     
-    @pytest.fixture
-    def case_with_grant(self, sample_case_data):
-        sample_case_data["incentives"] = {
-            "capital_grant": {
-                "enabled": True,
-                "percent_of_eligible": 0.40,
-                "accounting_policy": "A2",
-                "cash_receipt_schedule": [0.5, 0.5],
-            },
-        }
-        return BiometanoCase.model_validate(sample_case_data)
-    
-    def test_grant_in_accounting(self, case_with_grant):
-        proj = build_projections(case_with_grant)
+    def test_grant_in_accounting(self, projections_with_grant):
+        proj = projections_with_grant
         
         assert proj.accounting is not None
         assert proj.accounting.total_grant_amount > 0
@@ -180,8 +226,8 @@ class TestWithIncentives:
         expected_grant = 25000000 * 0.40
         assert abs(proj.accounting.total_grant_amount - expected_grant) < 1
     
-    def test_deferred_income_schedule(self, case_with_grant):
-        proj = build_projections(case_with_grant)
+    def test_deferred_income_schedule(self, projections_with_grant):
+        proj = projections_with_grant
         
         # Should have deferred income entries
         assert len(proj.accounting.deferred_income) > 0
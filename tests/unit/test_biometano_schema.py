@@ -1,6 +1,8 @@
 """
 Unit Tests for Biometano Schema
 """
+import copy
+
 import pytest
 from pydantic import ValidationError
 
@@ -140,42 +142,44 @@ class TestIncentives:
         assert grant.accounting_policy == GrantAccountingPolicy.DEFERRED_INCOME
 
 
+@pytest.fixture(scope="module")
+def minimal_case_data():
+    """Raw case dict shared by the module; copy it before mutating."""
+    return {
+        "horizon": {
+            "base_year": 2024,
+            "years_forecast": 10,
+            "construction_years": 2,
+        },
+        "production": {
+            "forsu_throughput_tpy": 60000,
+            "biomethane_mwh_y": 40000,
+        },
+        "revenues": {
+            "gate_fee": {"price": 190},
+            "tariff": {"price": 70},
+        },
+        "opex": {},
+        "capex": {
+            "epc": {"amount": 20000000},
+        },
+        "financing": {
+            "tax_rate": 0.24,
+            "rf": 0.03,
+            "rm": 0.08,
+            "beta": 1.2,
+        },
+        "incentives": {},
+        "terminal_value": {
+            "method": "perpetuity",
+            "perpetuity_growth": 0.0,
+        },
+    }
+
+
 class TestBiometanoCase:
     """Tests for complete case model."""
     
-    @pytest.fixture
-    def minimal_case_data(self):
-        return {
-            "horizon": {
-                "base_year": 2024,
-                "years_forecast": 10,
-                "construction_years": 2,
-            },
-            "production": {
-                "forsu_throughput_tpy": 60000,
-                "biomethane_mwh_y": 40000,
-            },
-            "revenues": {
-                "gate_fee": {"price": 190},
-                "tariff": {"price": 70},
-            },
-            "opex": {},
-            "capex": {
-                "epc": {"amount": 20000000},
-            },
-            "financing": {
-                "tax_rate": 0.24,
-                "rf": 0.03,
-                "rm": 0.08,
-                "beta": 1.2,
-            },
-            "incentives": {},
-            "terminal_value": {
-                "method": "perpetuity",
-                "perpetuity_growth": 0.0,
-            },
-        }
-    
     def test_minimal_case_loads(self, minimal_case_data):
         case = BiometanoCase.model_validate(minimal_case_data)
         assert case.horizon.base_year == 2024
@@ -183,7 +187,8 @@ class TestBiometanoCase:
         assert case.capex.total_capex() == 20000000
     
     def test_case_with_incentives(self, minimal_case_data):
-        minimal_case_data["incentives"] = {
+        data = copy.deepcopy(minimal_case_data)
+        data["incentives"] = {
             "capital_grant": {
                 "enabled": True,
                 "percent_of_eligible": 0.40,
@@ -195,7 +200,7 @@ class TestBiometanoCase:
                 "accounting_policy": "B1",
             },
         }
-        case = BiometanoCase.model_validate(minimal_case_data)
+        case = BiometanoCase.model_validate(data)
         assert case.incentives.capital_grant.enabled is True
         assert case.incentives.capital_grant.percent_of_eligible == 0.40
         assert case.incentives.tax_credit.enabled is True
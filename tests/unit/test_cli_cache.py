@@ -0,0 +1,30 @@
+"""
+Unit Tests for the CLI outputs cache
+"""
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from dcf_ui_cli import cli
+
+
+EXAMPLE_INPUT = Path(__file__).resolve().parents[2] / "examples" / "example_input.yaml"
+
+
+def test_corrupt_cache_entry_is_recomputed(tmp_path, monkeypatch):
+    """A garbage cache entry is dropped and the command still succeeds."""
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    monkeypatch.setattr(cli, "_CACHE_DIR", cache_dir)
+    cache_file = cache_dir / f"{cli._cache_key(EXAMPLE_INPUT)}.json"
+    cache_file.write_bytes(b"\x00not json{")
+
+    output = tmp_path / "out.xlsx"
+    result = CliRunner().invoke(
+        cli.app,
+        ["export", str(EXAMPLE_INPUT), "--output", str(output), "--xlsx-mode", "values"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert output.exists()
+    assert cache_file.read_bytes().startswith(b"{")
@@ -3,9 +3,11 @@ Unit Tests for DCF Engine Formulas
 
 Tests for individual calculation functions.
 """
+import numpy as np
 import pytest
 from dcf_engine.projections import (
     compute_revenue,
+    compute_revenue_vec,
     compute_operating_costs,
     compute_ebitda,
     compute_ebit,
@@ -29,11 +31,14 @@ from dcf_engine.cashflows import (
 from dcf_engine.discount_rates import compute_ke
 from dcf_engine.discounting import (
     compute_discount_factors,
+    compute_discount_factors_vec,
     compute_pv_series,
+    compute_pv_series_vec,
     compute_pv_single,
 )
 from dcf_engine.terminal_value import (
     compute_terminal_value_perpetuity,
+    compute_terminal_value_perpetuity_vec,
     compute_terminal_value_exit_multiple,
     TerminalValueError,
 )
@@ -42,68 +47,58 @@ from dcf_engine.valuation import (
     compute_net_debt,
     compute_equity_from_ev,
 )
-from dcf_engine.models import (
-    DCFInputs,
-    TimelineInputs,
-    RevenueInputs,
-    OperatingInputs,
-    NWCInputs,
-    InvestmentInputs,
-    TaxInputs,
-    CAPMInputs,
-    DebtInputs,
-    WACCInputs,
-    EquityBookInputs,
-    TerminalValueInputs,
-    NetDebtInputs,
-    DiscountingMode,
-    TerminalValueMethod,
-    WeightingMode,
-)
+from dcf_engine.models import DiscountingMode
 
 
 # ============================================================================
 # Test fixtures
 # ============================================================================
 
-@pytest.fixture
-def golden_inputs() -> DCFInputs:
-    """Create inputs matching the golden case."""
-    return DCFInputs(
-        timeline=TimelineInputs(
-            base_year=2022,
-            forecast_years=[2023, 2024, 2025],
-        ),
-        revenue=RevenueInputs(
-            base_revenue=12500.0,
-            growth_rates={2023: 0.15, 2024: 0.10, 2025: 0.10},
-        ),
-        operating=OperatingInputs(
-            cost_ratios={2023: 0.85, 2024: 0.83, 2025: 0.80},
-            depreciation_amortization={2022: 500, 2023: 550, 2024: 650, 2025: 700},
-        ),
-        nwc=NWCInputs(
-            nwc_percent={2022: 0.16, 2023: 0.16, 2024: 0.13, 2025: 0.10},
-        ),
-        investments=InvestmentInputs(
-            capex={2023: 800, 2024: 900, 2025: 1000},
-        ),
-        tax=TaxInputs(tax_rate=0.30),
-        capm=CAPMInputs(rf=0.04, rm=0.10, beta=1.30),
-        debt=DebtInputs(
-            debt_balances={2022: 1500, 2023: 2050, 2024: 2055.63, 2025: 2039.38},
-            rd={2022: 0.05, 2023: 0.06, 2024: 0.065, 2025: 0.065},
-        ),
-        wacc=WACCInputs(
-            weighting_mode=WeightingMode.BOOK_VALUE,
-            equity_book_inputs=EquityBookInputs(base_equity_book=10000.0),
-        ),
-        terminal_value=TerminalValueInputs(
-            method=TerminalValueMethod.PERPETUITY,
-            g=0.0,
-        ),
-        net_debt=NetDebtInputs(cash_and_equivalents=1492.10),
-        discounting_mode=DiscountingMode.YEAR_SPECIFIC_FLAT,
+# golden_inputs is a session fixture from conftest.py. The projection chain
+# is deterministic in it, so each stage is computed once per module; tests
+# call only the function under test.
+
+@pytest.fixture(scope="module")
+def revenue(golden_inputs):
+    return compute_revenue(golden_inputs)
+
+
+@pytest.fixture(scope="module")
+def operating_costs(golden_inputs, revenue):
+    return compute_operating_costs(golden_inputs, revenue)
+
+
+@pytest.fixture(scope="module")
+def ebitda(golden_inputs, revenue, operating_costs):
+    return compute_ebitda(golden_inputs, revenue, operating_costs)
+
+
+@pytest.fixture(scope="module")
+def ebit(golden_inputs, ebitda):
+    return compute_ebit(golden_inputs, ebitda)
+
+
+@pytest.fixture(scope="module")
+def nopat(golden_inputs, ebit):
+    return compute_nopat(golden_inputs, ebit)
+
+
+@pytest.fixture(scope="module")
+def nwc(golden_inputs, revenue):
+    return compute_nwc(golden_inputs, revenue)
+
+
+@pytest.fixture(scope="module")
+def delta_nwc(golden_inputs, nwc):
+    return compute_delta_nwc(golden_inputs, nwc)
+
+
+def _assert_years_close(series, expected, atol=1e-2):
+    """Compare ``series[year]`` to every ``expected`` year in one assertion."""
+    years = list(expected)
+    np.testing.assert_allclose(
+        [series[y] for y in years], [expected[y] for y in years], rtol=0, atol=atol,
+        err_msg=f"years {years}",
     )
 
 
@@ -120,6 +115,18 @@ class TestRevenue:
         assert revenue[2023] == pytest.approx(14375.0, abs=1e-2)
         assert revenue[2024] == pytest.approx(15812.5, abs=1e-2)
         assert revenue[2025] == pytest.approx(17393.75, abs=1e-2)
+    
+    def test_revenue_vec_matches_scalar(self, golden_inputs, revenue):
+        """Test batched revenue agrees with the per-year loop."""
+        growth = [golden_inputs.revenue.growth_rates[y] for y in (2023, 2024, 2025)]
+        
+        batch = compute_revenue_vec(
+            np.array([12500.0, 10000.0]), np.array([growth, [0.0, 0.0, 0.0]])
+        )
+        
+        assert batch.shape == (2, 3)
+        assert batch[0] == pytest.approx([revenue[2023], revenue[2024], revenue[2025]])
+        assert batch[1] == pytest.approx([10000.0, 10000.0, 10000.0])
 
 
 # ============================================================================
@@ -127,26 +134,25 @@ class TestRevenue:
 # ============================================================================
 
 class TestOperating:
-    def test_ebitda_from_cost_ratios(self, golden_inputs):
+    def test_ebitda_from_cost_ratios(self, golden_inputs, revenue, operating_costs):
         """Test EBITDA calculation from cost ratios."""
-        revenue = compute_revenue(golden_inputs)
-        operating_costs = compute_operating_costs(golden_inputs, revenue)
         ebitda = compute_ebitda(golden_inputs, revenue, operating_costs)
         
-        assert ebitda[2023] == pytest.approx(2156.25, abs=1e-2)
-        assert ebitda[2024] == pytest.approx(2688.125, abs=1e-2)
-        assert ebitda[2025] == pytest.approx(3478.75, abs=1e-2)
+        _assert_years_close(ebitda, {
+            2023: 2156.25,
+            2024: 2688.125,
+            2025: 3478.75,
+        })
     
-    def test_ebit_calculation(self, golden_inputs):
+    def test_ebit_calculation(self, golden_inputs, ebitda):
         """Test EBIT = EBITDA - D&A."""
-        revenue = compute_revenue(golden_inputs)
-        operating_costs = compute_operating_costs(golden_inputs, revenue)
-        ebitda = compute_ebitda(golden_inputs, revenue, operating_costs)
         ebit = compute_ebit(golden_inputs, ebitda)
         
-        assert ebit[2023] == pytest.approx(1606.25, abs=1e-2)
-        assert ebit[2024] == pytest.approx(2038.125, abs=1e-2)
-        assert ebit[2025] == pytest.approx(2778.75, abs=1e-2)
+        _assert_years_close(ebit, {
+            2023: 1606.25,
+            2024: 2038.125,
+            2025: 2778.75,
+        })
 
 
 # ============================================================================
@@ -154,32 +160,29 @@ class TestOperating:
 # ============================================================================
 
 class TestNWC:
-    def test_nwc_from_percent(self, golden_inputs):
+    def test_nwc_from_percent(self, golden_inputs, revenue):
         """Test NWC calculation from % of revenue."""
-        revenue = compute_revenue(golden_inputs)
         nwc = compute_nwc(golden_inputs, revenue)
         
-        assert nwc[2022] == pytest.approx(2000.0, abs=1e-2)
-        assert nwc[2023] == pytest.approx(2300.0, abs=1e-2)
-        assert nwc[2024] == pytest.approx(2055.625, abs=1e-2)
-        assert nwc[2025] == pytest.approx(1739.375, abs=1e-2)
+        _assert_years_close(nwc, {
+            2022: 2000.0,
+            2023: 2300.0,
+            2024: 2055.625,
+            2025: 1739.375,
+        })
     
-    def test_delta_nwc(self, golden_inputs):
+    def test_delta_nwc(self, golden_inputs, nwc):
         """Test ΔNWC calculation."""
-        revenue = compute_revenue(golden_inputs)
-        nwc = compute_nwc(golden_inputs, revenue)
         delta_nwc = compute_delta_nwc(golden_inputs, nwc)
         
-        assert delta_nwc[2023] == pytest.approx(300.0, abs=1e-2)
-        assert delta_nwc[2024] == pytest.approx(-244.375, abs=1e-2)
-        assert delta_nwc[2025] == pytest.approx(-316.25, abs=1e-2)
+        _assert_years_close(delta_nwc, {
+            2023: 300.0,
+            2024: -244.375,
+            2025: -316.25,
+        })
     
-    def test_delta_nwc_sign_convention(self, golden_inputs):
+    def test_delta_nwc_sign_convention(self, delta_nwc):
         """Test that positive ΔNWC means cash consumed."""
-        revenue = compute_revenue(golden_inputs)
-        nwc = compute_nwc(golden_inputs, revenue)
-        delta_nwc = compute_delta_nwc(golden_inputs, nwc)
-        
         # 2023: NWC increased -> cash consumed -> positive
         assert delta_nwc[2023] > 0
         # 2024, 2025: NWC decreased -> cash released -> negative
@@ -192,30 +195,26 @@ class TestNWC:
 # ============================================================================
 
 class TestTaxes:
-    def test_tax_on_ebit(self, golden_inputs):
+    def test_tax_on_ebit(self, golden_inputs, ebit):
         """Test tax on EBIT (Mode A)."""
-        revenue = compute_revenue(golden_inputs)
-        operating_costs = compute_operating_costs(golden_inputs, revenue)
-        ebitda = compute_ebitda(golden_inputs, revenue, operating_costs)
-        ebit = compute_ebit(golden_inputs, ebitda)
         tax_on_ebit = compute_tax_on_ebit(golden_inputs, ebit)
         
-        assert tax_on_ebit[2023] == pytest.approx(481.875, abs=1e-2)
-        assert tax_on_ebit[2024] == pytest.approx(611.4375, abs=1e-2)
-        assert tax_on_ebit[2025] == pytest.approx(833.625, abs=1e-2)
+        _assert_years_close(tax_on_ebit, {
+            2023: 481.875,
+            2024: 611.4375,
+            2025: 833.625,
+        })
     
-    def test_nopat(self, golden_inputs):
+    def test_nopat(self, golden_inputs, ebit):
         """Test NOPAT = EBIT * (1 - TaxRate)."""
-        revenue = compute_revenue(golden_inputs)
-        operating_costs = compute_operating_costs(golden_inputs, revenue)
-        ebitda = compute_ebitda(golden_inputs, revenue, operating_costs)
-        ebit = compute_ebit(golden_inputs, ebitda)
         nopat = compute_nopat(golden_inputs, ebit)
         
         # NOPAT = EBIT * 0.70
-        assert nopat[2023] == pytest.approx(1606.25 * 0.70, abs=1e-2)
-        assert nopat[2024] == pytest.approx(2038.125 * 0.70, abs=1e-2)
-        assert nopat[2025] == pytest.approx(2778.75 * 0.70, abs=1e-2)
+        _assert_years_close(nopat, {
+            2023: 1606.25 * 0.70,
+            2024: 2038.125 * 0.70,
+            2025: 2778.75 * 0.70,
+        })
 
 
 # ============================================================================
@@ -223,40 +222,39 @@ class TestTaxes:
 # ============================================================================
 
 class TestCashFlows:
-    def test_fcff_construction(self, golden_inputs):
+    def test_fcff_construction(self, golden_inputs, nopat, delta_nwc):
         """Test FCFF = NOPAT + D&A - ΔNWC - Capex."""
-        revenue = compute_revenue(golden_inputs)
-        operating_costs = compute_operating_costs(golden_inputs, revenue)
-        ebitda = compute_ebitda(golden_inputs, revenue, operating_costs)
-        ebit = compute_ebit(golden_inputs, ebitda)
-        nopat = compute_nopat(golden_inputs, ebit)
-        nwc = compute_nwc(golden_inputs, revenue)
-        delta_nwc = compute_delta_nwc(golden_inputs, nwc)
         da = golden_inputs.operating.depreciation_amortization
         capex = golden_inputs.investments.capex
         
         fcff = compute_fcff(nopat, da, delta_nwc, capex)
         
-        assert fcff[2023] == pytest.approx(574.375, abs=1e-2)
-        assert fcff[2024] == pytest.approx(1421.0625, abs=1e-2)
-        assert fcff[2025] == pytest.approx(1961.375, abs=1e-2)
+        _assert_years_close(fcff, {
+            2023: 574.375,
+            2024: 1421.0625,
+            2025: 1961.375,
+        })
     
     def test_interest_expense_end_of_period(self, golden_inputs):
         """Test interest expense uses end-of-period convention."""
         interest = compute_interest_expense(golden_inputs)
         
         # Interest_t = Debt_t * rd_t
-        assert interest[2023] == pytest.approx(2050 * 0.06, abs=1e-4)
-        assert interest[2024] == pytest.approx(2055.63 * 0.065, abs=1e-4)
-        assert interest[2025] == pytest.approx(2039.38 * 0.065, abs=1e-4)
+        _assert_years_close(interest, {
+            2023: 2050 * 0.06,
+            2024: 2055.63 * 0.065,
+            2025: 2039.38 * 0.065,
+        }, atol=1e-4)
     
     def test_net_borrowing(self, golden_inputs):
         """Test net borrowing = Debt_t - Debt_(t-1)."""
         net_borrowing = compute_net_borrowing(golden_inputs)
         
-        assert net_borrowing[2023] == pytest.approx(2050 - 1500, abs=1e-2)
-        assert net_borrowing[2024] == pytest.approx(2055.63 - 2050, abs=1e-2)
-        assert net_borrowing[2025] == pytest.approx(2039.38 - 2055.63, abs=1e-2)
+        _assert_years_close(net_borrowing, {
+            2023: 2050 - 1500,
+            2024: 2055.63 - 2050,
+            2025: 2039.38 - 2055.63,
+        })
 
 
 # ============================================================================
@@ -287,9 +285,11 @@ class TestDiscounting:
         )
         
         # DF_i = 1 / (1 + r_i)^i
-        assert df[2023] == pytest.approx(1 / (1.10 ** 1), abs=1e-6)
-        assert df[2024] == pytest.approx(1 / (1.11 ** 2), abs=1e-6)
-        assert df[2025] == pytest.approx(1 / (1.12 ** 3), abs=1e-6)
+        _assert_years_close(df, {
+            2023: 1 / (1.10 ** 1),
+            2024: 1 / (1.11 ** 2),
+            2025: 1 / (1.12 ** 3),
+        }, atol=1e-6)
     
     def test_constant_discounting(self):
         """Test constant rate discounting mode."""
@@ -301,9 +301,38 @@ class TestDiscounting:
         )
         
         # DF_i = 1 / (1 + r)^i
-        assert df[2023] == pytest.approx(1 / (1.10 ** 1), abs=1e-6)
-        assert df[2024] == pytest.approx(1 / (1.10 ** 2), abs=1e-6)
-        assert df[2025] == pytest.approx(1 / (1.10 ** 3), abs=1e-6)
+        _assert_years_close(df, {
+            2023: 1 / (1.10 ** 1),
+            2024: 1 / (1.10 ** 2),
+            2025: 1 / (1.10 ** 3),
+        }, atol=1e-6)
+    
+    def test_empty_horizon_discounting(self):
+        """Test that no years give no discount factors, and no rates raise."""
+        for mode in DiscountingMode:
+            assert compute_discount_factors({}, [], 2022, mode) == {}
+            assert compute_discount_factors(0.10, [], 2022, mode) == {}
+        with pytest.raises(ValueError, match="no discount rate"):
+            compute_discount_factors({}, [2023], 2022, DiscountingMode.CONSTANT)
+    
+    def test_discount_factors_vec_matches_scalar(self):
+        """Test batched discount factors and PVs agree with the dict API."""
+        rates = {2023: 0.10, 2024: 0.11, 2025: 0.12}
+        years = [2023, 2024, 2025]
+        cash_flows = {2023: 100.0, 2024: 200.0, 2025: 300.0}
+        df = compute_discount_factors(
+            rates, years, 2022, DiscountingMode.YEAR_SPECIFIC_FLAT
+        )
+        pv = compute_pv_series(cash_flows, df)
+        
+        df_vec = compute_discount_factors_vec(
+            np.array([list(rates.values()), [0.10, 0.10, 0.10]]), np.array([1, 2, 3])
+        )
+        pv_vec = compute_pv_series_vec(np.array(list(cash_flows.values())), df_vec)
+        
+        assert df_vec[0] == pytest.approx([df[y] for y in years], abs=1e-12)
+        assert df_vec[1] == pytest.approx([1 / 1.10, 1 / 1.10 ** 2, 1 / 1.10 ** 3], abs=1e-12)
+        assert pv_vec[0] == pytest.approx([pv[y] for y in years], abs=1e-9)
     
     def test_pv_single(self):
         """Test single value present value calculation."""
@@ -346,6 +375,20 @@ class TestTerminalValue:
         with pytest.raises(TerminalValueError):
             compute_terminal_value_perpetuity(100, 0.10, 0.15)
     
+    def test_perpetuity_vec_matches_scalar(self):
+        """Test batched perpetuity TV; invalid scenarios become NaN."""
+        cf = np.array([100.0, 100.0, 100.0, 100.0])
+        r = np.array([0.10, 0.10, 0.10, 0.10])
+        g = np.array([0.02, 0.0, 0.10, 0.15])
+        
+        tv = compute_terminal_value_perpetuity_vec(cf, r, g)
+        
+        assert tv[:2] == pytest.approx([
+            compute_terminal_value_perpetuity(100, 0.10, 0.02),
+            compute_terminal_value_perpetuity(100, 0.10, 0.0),
+        ], abs=1e-9)
+        assert np.isnan(tv[2:]).all()
+    
     def test_exit_multiple(self):
         """Test exit multiple terminal value."""
         tv = compute_terminal_value_exit_multiple(500, 8.0)
@@ -3,67 +3,19 @@ from pathlib import Path
 from openpyxl import load_workbook
 
 from dcf_engine.engine import DCFEngine
-from dcf_engine.models import (
-    DCFInputs,
-    TimelineInputs,
-    RevenueInputs,
-    OperatingInputs,
-    NWCInputs,
-    InvestmentInputs,
-    TaxInputs,
-    CAPMInputs,
-    DebtInputs,
-    WACCInputs,
-    EquityBookInputs,
-    TerminalValueInputs,
-    NetDebtInputs,
-    DiscountingMode,
-    TerminalValueMethod,
-    WeightingMode,
-)
+from dcf_engine.models import DCFInputs
 from dcf_io.writers import export_xlsx
 from dcf_io.xlsx_validation import FormulaCheck, find_missing_formulas
 
 
-def _make_golden_inputs() -> DCFInputs:
-    return DCFInputs(
-        discounting_mode=DiscountingMode.YEAR_SPECIFIC_FLAT,
-        timeline=TimelineInputs(base_year=2022, forecast_years=[2023, 2024, 2025]),
-        revenue=RevenueInputs(
-            base_revenue=12500.0,
-            growth_rates={2023: 0.15, 2024: 0.10, 2025: 0.10},
-        ),
-        operating=OperatingInputs(
-            cost_ratios={2023: 0.85, 2024: 0.83, 2025: 0.80},
-            depreciation_amortization={2022: 500.0, 2023: 550.0, 2024: 650.0, 2025: 700.0},
-        ),
-        nwc=NWCInputs(
-            nwc_percent={2022: 0.16, 2023: 0.16, 2024: 0.13, 2025: 0.10},
-        ),
-        investments=InvestmentInputs(capex={2023: 800.0, 2024: 900.0, 2025: 1000.0}),
-        tax=TaxInputs(tax_rate=0.30),
-        capm=CAPMInputs(rf=0.04, rm=0.10, beta=1.30),
-        debt=DebtInputs(
-            debt_balances={2022: 1500.0, 2023: 2050.0, 2024: 2055.63, 2025: 2039.38},
-            rd={2022: 0.05, 2023: 0.06, 2024: 0.065, 2025: 0.065},
-        ),
-        wacc=WACCInputs(
-            weighting_mode=WeightingMode.BOOK_VALUE,
-            equity_book_inputs=EquityBookInputs(base_equity_book=10000.0),
-        ),
-        terminal_value=TerminalValueInputs(method=TerminalValueMethod.PERPETUITY, g=0.0),
-        net_debt=NetDebtInputs(cash_and_equivalents=1492.10),
-    )
-
-
-def test_export_xlsx_formulas(tmp_path: Path) -> None:
-    inputs = _make_golden_inputs()
-    outputs = DCFEngine(inputs).run()
+def test_export_xlsx_formulas(tmp_path: Path, golden_inputs: DCFInputs) -> None:
+    outputs = DCFEngine(golden_inputs).run()
     out_path = tmp_path / "dcf_formulas.xlsx"
 
-    export_xlsx(outputs, out_path, xlsx_mode="formulas")
+    wb = export_xlsx(outputs, out_path, xlsx_mode="formulas")
 
-    wb = load_workbook(out_path, data_only=False)
+    # Assertions run against the workbook that was just saved, so the file
+    # does not have to be parsed again for each check.
     assert "Assumptions" in wb.sheetnames
     assert "Cash_Flow" in wb.sheetnames
     assert "Discounting" in wb.sheetnames
@@ -93,3 +45,33 @@ def test_export_xlsx_formulas(tmp_path: Path) -> None:
 
     assumptions = wb["Assumptions"]
     assert not (isinstance(assumptions["B2"].value, str) and assumptions["B2"].value.startswith("="))
+
+
+def test_export_xlsx_formulas_file_roundtrip(tmp_path: Path, golden_inputs: DCFInputs) -> None:
+    out_path = tmp_path / "dcf_formulas.xlsx"
+    wb = export_xlsx(DCFEngine(golden_inputs).run(), out_path, xlsx_mode="formulas")
+
+    saved = load_workbook(out_path, data_only=False, read_only=True)
+    try:
+        assert saved.sheetnames == wb.sheetnames
+        assert saved["Cash_Flow"]["B6"].value == wb["Cash_Flow"]["B6"].value
+    finally:
+        saved.close()
+
+
+def test_export_xlsx_values(tmp_path: Path, golden_inputs: DCFInputs) -> None:
+    outputs = DCFEngine(golden_inputs).run()
+    out_path = tmp_path / "dcf_values.xlsx"
+
+    export_xlsx(outputs, out_path, xlsx_mode="values")
+
+    wb = load_workbook(out_path, read_only=True)
+    try:
+        assert wb.sheetnames
+        for ws in wb.worksheets:
+            header = next(ws.iter_rows(min_row=1, max_row=1, values_only=True))
+            assert all(isinstance(value, str) for value in header)
+            for row in ws.iter_rows(min_row=2, values_only=True):
+                assert not any(isinstance(value, str) and value.startswith("=") for value in row)
+    finally:
+        wb.close()